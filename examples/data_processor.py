@@ -1,10 +1,12 @@
 """Example script for debugging - processes data with various transformations."""
 
+from collections import defaultdict
 from collections.abc import Callable
 from dataclasses import dataclass
+from operator import attrgetter
 
 
-@dataclass
+@dataclass(slots=True)
 class Record:
     """A simple data record."""
 
@@ -36,9 +38,6 @@ def filter_records(records: list[Record], predicate: Callable[[Record], bool]) -
     for record in records:
         if predicate(record):
             result.append(record)
-            print(f"  Included: {record.name} (value={record.value})")
-        else:
-            print(f"  Excluded: {record.name}")
     return result
 
 
@@ -55,16 +54,13 @@ def transform_values(records: list[Record], transformer: Callable[[float], float
             category=record.category,
         )
         result.append(new_record)
-        print(f"  {record.name}: {old_value:.2f} -> {new_value:.2f}")
     return result
 
 
 def group_by_category(records: list[Record]) -> dict[str, list[Record]]:
     """Group records by their category."""
-    groups: dict[str, list[Record]] = {}
+    groups: defaultdict[str, list[Record]] = defaultdict(list)
     for record in records:
-        if record.category not in groups:
-            groups[record.category] = []
         groups[record.category].append(record)
     return groups
 
@@ -74,11 +70,12 @@ def calculate_statistics(records: list[Record]) -> dict[str, float]:
     if not records:
         return {"count": 0, "sum": 0, "avg": 0, "min": 0, "max": 0}
 
-    values = [r.value for r in records]
+    values = list(map(attrgetter("value"), records))
+    total = sum(values)
     return {
         "count": len(values),
-        "sum": sum(values),
-        "avg": sum(values) / len(values),
+        "sum": total,
+        "avg": total / len(values),
         "min": min(values),
         "max": max(values),
     }
@@ -105,14 +102,14 @@ def main():
 
     # Group by category
     print("\n4. Grouping by category...")
-    groups = group_by_category(transformed)
-    for category, group_records in sorted(groups.items()):
-        names = [r.name for r in group_records]
+    groups = sorted(group_by_category(transformed).items())
+    for category, group_records in groups:
+        names = list(map(attrgetter("name"), group_records))
         print(f"   Category {category}: {names}")
 
     # Calculate statistics per category
     print("\n5. Statistics by category:")
-    for category, group_records in sorted(groups.items()):
+    for category, group_records in groups:
         stats = calculate_statistics(group_records)
         print(f"   Category {category}:")
         print(f"      Count: {stats['count']}")
@@ -28,9 +28,11 @@ Suggested breakpoints:
 
 from dataclasses import dataclass
 from datetime import datetime
+from math import fsum
+from operator import mul
 
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     """Represents a customer order."""
 
@@ -44,7 +46,7 @@ class Order:
     @property
     def subtotal(self) -> float:
         """Calculate order subtotal before discount."""
-        return sum(q * p for q, p in zip(self.quantities, self.prices))
+        return fsum(map(mul, self.quantities, self.prices))
 
     @property
     def total(self) -> float:
@@ -69,12 +71,13 @@ def calculate_statistics(orders: list[Order]) -> dict:
 
     # Breakpoint here to watch stats update each iteration
     for order in orders:
+        order_total = order.total
         stats["count"] += 1
-        stats["total_revenue"] += order.total
+        stats["total_revenue"] += order_total
         stats["items_sold"] += sum(order.quantities)
 
-        if order.total > stats["largest_order"]:
-            stats["largest_order"] = order.total
+        if order_total > stats["largest_order"]:
+            stats["largest_order"] = order_total
             largest_customer = order.customer  # Try evaluating this!
 
     # Breakpoint here to see final computed stats
@@ -105,6 +108,7 @@ def process_order(order: Order) -> dict:
     }
 
     # Process each item - good place for conditional breakpoint
+    lines = []
     for i, (item, qty, price) in enumerate(zip(order.items, order.quantities, order.prices)):
         line_total = qty * price
         receipt["items"].append(
@@ -118,7 +122,9 @@ def process_order(order: Order) -> dict:
         receipt["subtotal"] += line_total
 
         # Debug tip: Set conditional breakpoint here with "line_total > 50"
-        print(f"  {qty}x {item} @ ${price:.2f} = ${line_total:.2f}")
+        lines.append(f"  {qty}x {item} @ ${price:.2f} = ${line_total:.2f}")
+
+    print("\n".join(lines))
 
     receipt["discount"] = receipt["subtotal"] * order.discount
     receipt["total"] = receipt["subtotal"] - receipt["discount"]
@@ -134,11 +140,13 @@ def find_vip_customers(orders: list[Order], threshold: float = 100.0) -> list[st
         Set breakpoint on line with condition "order.total > threshold"
     """
     vip_customers = []
+    seen: set[str] = set()
 
     for order in orders:
         # Conditional breakpoint: order.total > threshold
         if order.total > threshold:
-            if order.customer not in vip_customers:
+            if order.customer not in seen:
+                seen.add(order.customer)
                 vip_customers.append(order.customer)
                 print(f"  VIP: {order.customer} (${order.total:.2f})")
 
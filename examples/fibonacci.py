@@ -26,10 +26,11 @@ def fibonacci_iterative(n: int) -> int:
 def fibonacci_sequence(count: int) -> list[int]:
     """Generate a sequence of Fibonacci numbers."""
     sequence = []
+    a, b = 0, 1
     for i in range(count):
-        value = fibonacci_iterative(i)
-        sequence.append(value)
-        print(f"fib({i}) = {value}")
+        sequence.append(a)
+        print(f"fib({i}) = {a}")
+        a, b = b, a + b
     return sequence
 
 
@@ -4,6 +4,7 @@ This module defines the interface that all container runtime implementations
 (Docker, Podman, Kubernetes) must implement.
 """
 
+import time
 from abc import ABC, abstractmethod
 from typing import Any
 
@@ -78,6 +79,13 @@ class ContainerRuntimeAdapter(ABC):
     to provide container debugging capabilities.
     """
 
+    # How long a ContainerInfo lookup is reused before re-inspecting (seconds)
+    info_cache_ttl: float = 2.0
+
+    def __init__(self) -> None:
+        """Initialize per-adapter caches."""
+        self._info_cache: dict[str, tuple[float, ContainerInfo]] = {}
+
     @property
     @abstractmethod
     def runtime_type(self) -> ContainerRuntime:
@@ -123,6 +131,7 @@ class ContainerRuntimeAdapter(ABC):
         workdir: str | None = None,
         timeout: float = 30.0,
         user: str | None = None,
+        verify_running: bool = True,
     ) -> ExecResult:
         """Execute a command inside a container.
 
@@ -133,6 +142,8 @@ class ContainerRuntimeAdapter(ABC):
             workdir: Working directory inside container
             timeout: Command timeout in seconds
             user: User to run command as
+            verify_running: Check the container state before executing. Pass
+                False when the caller has just confirmed the container is up.
 
         Returns:
             ExecResult with stdout, stderr, and exit code
@@ -233,6 +244,58 @@ class ContainerRuntimeAdapter(ABC):
         """
         ...
 
+    async def get_cached_container_info(self, target: ContainerTarget) -> ContainerInfo:
+        """Get container information, reusing a recent lookup for the same target.
+
+        Args:
+            target: Container target specification
+
+        Returns:
+            ContainerInfo no older than the adapter's info cache TTL
+
+        Raises:
+            ContainerNotFoundError: If container doesn't exist
+        """
+        key = target.identifier
+        cached = self._info_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self.info_cache_ttl:
+            return cached[1]
+
+        info = await self.get_container_info(target)
+        self._info_cache[key] = (time.monotonic(), info)
+        return info
+
+    async def get_container_infos(self, targets: list[ContainerTarget]) -> list[ContainerInfo]:
+        """Get information for several containers and refresh the info cache.
+
+        The default implementation looks each target up in turn; adapters
+        whose runtime can describe many containers in one call should
+        override it.
+
+        Args:
+            targets: Container target specifications
+
+        Returns:
+            ContainerInfo for each target, in the same order
+
+        Raises:
+            ContainerNotFoundError: If any container doesn't exist
+        """
+        infos: list[ContainerInfo] = []
+        for target in targets:
+            info = await self.get_container_info(target)
+            self._info_cache[target.identifier] = (time.monotonic(), info)
+            infos.append(info)
+        return infos
+
+    def invalidate_container_info(self, target: ContainerTarget) -> None:
+        """Drop any cached container information for a target.
+
+        Call after operations that may change the container's state or
+        network configuration.
+        """
+        self._info_cache.pop(target.identifier, None)
+
     async def get_debugpy_endpoint(
         self,
         target: ContainerTarget,
@@ -250,7 +313,7 @@ class ContainerRuntimeAdapter(ABC):
         Returns:
             Tuple of (host, port) to connect to
         """
-        info = await self.get_container_info(target)
+        info = await self.get_cached_container_info(target)
 
         # Check for mapped port first
         if container_port in info.ports:
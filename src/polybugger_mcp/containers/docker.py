@@ -7,8 +7,11 @@ adapter for debugging Python processes in Docker containers.
 import asyncio
 import json
 import logging
+import os
 import shutil
+import time
 from datetime import datetime
+from typing import Any
 
 from polybugger_mcp.containers.base import (
     ContainerError,
@@ -19,6 +22,7 @@ from polybugger_mcp.containers.base import (
     ContainerSecurityError,
 )
 from polybugger_mcp.containers.models import (
+    PROC_SCAN_SCRIPT,
     ContainerInfo,
     ContainerState,
     ExecResult,
@@ -29,6 +33,25 @@ from polybugger_mcp.models.container import ContainerRuntime, ContainerTarget
 logger = logging.getLogger(__name__)
 
 
+# Docker's State.Status values
+_STATE_MAP: dict[str, ContainerState] = {
+    "created": ContainerState.CREATED,
+    "running": ContainerState.RUNNING,
+    "paused": ContainerState.PAUSED,
+    "restarting": ContainerState.RESTARTING,
+    "removing": ContainerState.REMOVING,
+    "exited": ContainerState.EXITED,
+    "dead": ContainerState.DEAD,
+}
+
+# pip invocations tried, in order, when installing debugpy in a container
+_PIP_INSTALL_DEBUGPY = (
+    "pip install --quiet debugpy",
+    "pip3 install --quiet debugpy",
+    "python -m pip install --quiet debugpy",
+)
+
+
 class DockerRuntime(ContainerRuntimeAdapter):
     """Docker container runtime adapter.
 
@@ -42,6 +65,7 @@ class DockerRuntime(ContainerRuntimeAdapter):
         Args:
             cli_override: Override the CLI command (useful for Podman)
         """
+        super().__init__()
         self._cli_override = cli_override
 
     @property
@@ -58,8 +82,12 @@ class DockerRuntime(ContainerRuntimeAdapter):
 
     async def is_available(self) -> bool:
         """Check if Docker CLI is available."""
-        cmd = shutil.which(self.cli_command)
-        if not cmd:
+        # An absolute CLI path (e.g. a Podman override) needs no PATH search
+        cli = self.cli_command
+        if os.path.isabs(cli):
+            if not os.access(cli, os.X_OK):
+                return False
+        elif not shutil.which(cli):
             return False
 
         try:
@@ -97,7 +125,8 @@ class DockerRuntime(ContainerRuntimeAdapter):
             ExecResult with stdout, stderr, exit code
         """
         cmd = [self.cli_command, *args]
-        logger.debug(f"Running: {' '.join(cmd)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Running: {' '.join(cmd)}")
 
         try:
             proc = await asyncio.create_subprocess_exec(
@@ -174,36 +203,83 @@ class DockerRuntime(ContainerRuntimeAdapter):
                 details={"container": container},
             )
 
+        return self._parse_inspect(data)
+
+    async def get_container_infos(self, targets: list[ContainerTarget]) -> list[ContainerInfo]:
+        """Get information for several containers with a single inspect call.
+
+        Results are returned in the order of ``targets`` and stored in the
+        container info cache.
+        """
+        containers = [self._get_container_identifier(t) for t in targets]
+        if not containers:
+            return []
+        if not all(containers):
+            raise ContainerNotFoundError("(empty)", self.cli_command)
+
+        # docker inspect prints one JSON document per line for the containers it
+        # found, and exits non-zero if any were missing
+        result = await self._run_cli("inspect", "--format", "{{json .}}", *containers)
+
+        parsed: list[ContainerInfo] = []
+        for line in result.stdout.splitlines():
+            if not line.strip():
+                continue
+            try:
+                parsed.append(self._parse_inspect(json.loads(line)))
+            except json.JSONDecodeError:
+                raise ContainerError(
+                    f"Failed to parse container info: {line[:200]}",
+                    details={"containers": containers},
+                )
+
+        # Exact ID/name matches take precedence over ID prefixes, so a short hex
+        # name can't be paired with another container whose ID starts with it
+        by_id = {str(i.runtime_data.get("Id", "")): i for i in parsed}
+        by_name = {i.name: i for i in parsed}
+
+        infos: list[ContainerInfo] = []
+        now = time.monotonic()
+        for target, container in zip(targets, containers):
+            info = by_id.get(container) or by_name.get(container.lstrip("/"))
+            if info is None:
+                info = next(
+                    (i for i in parsed if str(i.runtime_data.get("Id", "")).startswith(container)),
+                    None,
+                )
+            if info is None:
+                if not result.success and (
+                    "No such" in result.stderr or "not found" in result.stderr.lower()
+                ):
+                    raise ContainerNotFoundError(container, self.cli_command)
+                raise ContainerError(
+                    f"Failed to inspect container: {result.stderr}",
+                    details={"container": container},
+                )
+            self._info_cache[target.identifier] = (now, info)
+            infos.append(info)
+
+        return infos
+
+    def _parse_inspect(self, data: dict[str, Any]) -> ContainerInfo:
+        """Build ContainerInfo from a parsed ``docker inspect`` document."""
         # Parse state
         state_str = data.get("State", {}).get("Status", "unknown").lower()
-        state_map = {
-            "created": ContainerState.CREATED,
-            "running": ContainerState.RUNNING,
-            "paused": ContainerState.PAUSED,
-            "restarting": ContainerState.RESTARTING,
-            "removing": ContainerState.REMOVING,
-            "exited": ContainerState.EXITED,
-            "dead": ContainerState.DEAD,
-        }
-        state = state_map.get(state_str, ContainerState.UNKNOWN)
+        state = _STATE_MAP.get(state_str, ContainerState.UNKNOWN)
 
         # Parse network info
-        networks = data.get("NetworkSettings", {}).get("Networks", {})
-        ip_address = None
-        for net in networks.values():
-            if net.get("IPAddress"):
-                ip_address = net["IPAddress"]
-                break
+        network_settings = data.get("NetworkSettings") or {}
+        networks = network_settings.get("Networks") or {}
+        ip_address = next(
+            (net["IPAddress"] for net in networks.values() if net.get("IPAddress")),
+            None,
+        )
 
         # Parse port mappings
         ports: dict[int, int] = {}
-        port_bindings = data.get("NetworkSettings", {}).get("Ports", {})
-        for container_port_str, bindings in port_bindings.items():
-            if bindings:
-                container_port = int(container_port_str.split("/")[0])
-                host_port = int(bindings[0].get("HostPort", 0))
-                if host_port:
-                    ports[container_port] = host_port
+        for container_port_str, bindings in (network_settings.get("Ports") or {}).items():
+            if bindings and (host_port := int(bindings[0].get("HostPort") or 0)):
+                ports[int(container_port_str.partition("/")[0])] = host_port
 
         # Parse creation time
         created = None
@@ -235,16 +311,18 @@ class DockerRuntime(ContainerRuntimeAdapter):
         workdir: str | None = None,
         timeout: float = 30.0,
         user: str | None = None,
+        verify_running: bool = True,
     ) -> ExecResult:
         """Execute a command inside a container."""
         container = self._get_container_identifier(target)
         if not container:
             raise ContainerNotFoundError("(empty)", self.cli_command)
 
-        # Verify container is running
-        info = await self.get_container_info(target)
-        if not info.is_running:
-            raise ContainerNotRunningError(container, info.state.value)
+        # Verify container is running (a recent inspect is good enough)
+        if verify_running:
+            info = await self.get_cached_container_info(target)
+            if not info.is_running:
+                raise ContainerNotRunningError(container, info.state.value)
 
         # Build exec command
         args = ["exec"]
@@ -262,7 +340,13 @@ class DockerRuntime(ContainerRuntimeAdapter):
         args.append(container)
         args.extend(command)
 
-        return await self._run_cli(*args, timeout=timeout)
+        result = await self._run_cli(*args, timeout=timeout)
+        if not result.success and "is not running" in result.stderr:
+            # Container stopped since it was last inspected
+            self.invalidate_container_info(target)
+            if not verify_running:
+                raise ContainerNotRunningError(container, ContainerState.EXITED.value)
+        return result
 
     async def find_python_processes(self, target: ContainerTarget) -> list[ProcessInfo]:
         """Find Python processes in a container."""
@@ -273,30 +357,29 @@ class DockerRuntime(ContainerRuntimeAdapter):
             timeout=10.0,
         )
 
-        if not result.success:
-            # Some containers don't have ps, try /proc
+        if result.success:
+            parse = ProcessInfo.from_ps_line
+            lines = result.stdout.strip().split("\n")[1:]  # Skip header
+        else:
+            # Some containers don't have ps, scan /proc in a single exec
             result = await self.exec_command(
                 target,
-                [
-                    "sh",
-                    "-c",
-                    "for pid in /proc/[0-9]*; do "
-                    'echo "$(cat $pid/stat 2>/dev/null | cut -d" " -f1,2) '
-                    '$(cat $pid/cmdline 2>/dev/null | tr "\\0" " ")"; '
-                    "done",
-                ],
+                ["sh", "-c", PROC_SCAN_SCRIPT],
                 timeout=10.0,
+                verify_running=False,
             )
-
-        if not result.success:
-            logger.warning(f"Failed to list processes: {result.stderr}")
-            return []
+            if not result.success:
+                logger.warning(f"Failed to list processes: {result.stderr}")
+                return []
+            parse = ProcessInfo.from_proc_line
+            lines = result.stdout.split("\n")
 
         processes: list[ProcessInfo] = []
-        lines = result.stdout.strip().split("\n")
-
-        for line in lines[1:]:  # Skip header
-            proc = ProcessInfo.from_ps_line(line)
+        for line in lines:
+            # Most processes aren't Python; skip them before parsing
+            if "python" not in line.lower():
+                continue
+            proc = parse(line)
             if proc and proc.is_python:
                 processes.append(proc)
 
@@ -313,29 +396,15 @@ class DockerRuntime(ContainerRuntimeAdapter):
 
     async def install_debugpy(self, target: ContainerTarget) -> None:
         """Install debugpy in the container."""
-        # Try pip first
+        # Try each pip entry point in turn within a single exec, rather than
+        # paying a container round-trip per candidate. The attempts stay
+        # sequential: concurrent installs would race on site-packages.
         result = await self.exec_command(
             target,
-            ["pip", "install", "--quiet", "debugpy"],
+            ["sh", "-c", " || ".join(_PIP_INSTALL_DEBUGPY)],
             timeout=60.0,
         )
 
-        if not result.success:
-            # Try pip3
-            result = await self.exec_command(
-                target,
-                ["pip3", "install", "--quiet", "debugpy"],
-                timeout=60.0,
-            )
-
-        if not result.success:
-            # Try python -m pip
-            result = await self.exec_command(
-                target,
-                ["python", "-m", "pip", "install", "--quiet", "debugpy"],
-                timeout=60.0,
-            )
-
         if not result.success:
             raise ContainerExecError(
                 "pip install debugpy",
@@ -369,6 +438,7 @@ class DockerRuntime(ContainerRuntimeAdapter):
                 str(process_id),
             ],
             timeout=30.0,
+            verify_running=False,
         )
 
         if not result.success:
@@ -401,6 +471,7 @@ class DockerRuntime(ContainerRuntimeAdapter):
                 result.stderr,
             )
 
+        self.invalidate_container_info(target)
         logger.info(f"Injected debugpy into PID {process_id} in container {target.identifier}")
 
     async def launch_with_debugpy(
@@ -454,4 +525,5 @@ class DockerRuntime(ContainerRuntimeAdapter):
                 result.stderr,
             )
 
+        self.invalidate_container_info(target)
         logger.info(f"Launched debugpy in container {target.identifier} on port {port}")
@@ -4,6 +4,7 @@ This module provides factory functions for creating container runtime
 adapters based on the runtime type (Docker, Podman, Kubernetes).
 """
 
+import functools
 from collections.abc import Callable
 from typing import TypeVar
 
@@ -44,11 +45,40 @@ def register_runtime(
 
     def decorator(cls: type[T]) -> type[T]:
         _RUNTIME_REGISTRY[runtime] = cls
+        _get_adapter_class.cache_clear()
+        _supported_runtime_names.cache_clear()
         return cls
 
     return decorator
 
 
+@functools.cache
+def _get_adapter_class(runtime: str | ContainerRuntime) -> type[ContainerRuntimeAdapter]:
+    """Resolve a runtime identifier to its registered adapter class.
+
+    Cached per identifier; the cache is cleared whenever a runtime is registered.
+    Adapters hold per-instance state (e.g. Kubernetes port-forwards), so only
+    the class lookup is cached, never the instances.
+
+    Raises:
+        UnsupportedRuntimeError: If runtime is not supported
+    """
+    # Normalize to enum
+    if isinstance(runtime, ContainerRuntime):
+        runtime_enum = runtime
+    else:
+        try:
+            runtime_enum = ContainerRuntime(runtime.lower())
+        except ValueError:
+            raise UnsupportedRuntimeError(runtime)
+
+    adapter_class = _RUNTIME_REGISTRY.get(runtime_enum)
+    if adapter_class is None:
+        raise UnsupportedRuntimeError(runtime_enum.value)
+
+    return adapter_class
+
+
 def create_runtime(
     runtime: str | ContainerRuntime,
     **kwargs: str,
@@ -65,21 +95,7 @@ def create_runtime(
     Raises:
         UnsupportedRuntimeError: If runtime is not supported
     """
-    # Normalize to enum
-    if isinstance(runtime, str):
-        try:
-            runtime_enum = ContainerRuntime(runtime.lower())
-        except ValueError:
-            raise UnsupportedRuntimeError(runtime)
-    else:
-        runtime_enum = runtime
-
-    # Get adapter class
-    adapter_class = _RUNTIME_REGISTRY.get(runtime_enum)
-    if adapter_class is None:
-        raise UnsupportedRuntimeError(runtime_enum.value)
-
-    return adapter_class(**kwargs)
+    return _get_adapter_class(runtime)(**kwargs)
 
 
 def create_runtime_for_target(target: ContainerTarget, **kwargs: str) -> ContainerRuntimeAdapter:
@@ -95,6 +111,12 @@ def create_runtime_for_target(target: ContainerTarget, **kwargs: str) -> Contain
     return create_runtime(target.runtime, **kwargs)
 
 
+@functools.cache
+def _supported_runtime_names() -> frozenset[str]:
+    """Registered runtime identifiers, cleared whenever a runtime is registered."""
+    return frozenset(rt.value for rt in _RUNTIME_REGISTRY)
+
+
 def get_supported_runtimes() -> list[str]:
     """Get list of supported runtime identifiers.
 
@@ -113,11 +135,7 @@ def is_runtime_supported(runtime: str) -> bool:
     Returns:
         True if an adapter is registered for the runtime
     """
-    try:
-        runtime_enum = ContainerRuntime(runtime.lower())
-        return runtime_enum in _RUNTIME_REGISTRY
-    except ValueError:
-        return False
+    return runtime.lower() in _supported_runtime_names()
 
 
 # =============================================================================
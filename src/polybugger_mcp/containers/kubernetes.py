@@ -7,7 +7,10 @@ adapter for debugging Python processes in Kubernetes pods.
 import asyncio
 import json
 import logging
+import shlex
 import shutil
+import time
+from typing import Any
 
 from polybugger_mcp.containers.base import (
     ContainerError,
@@ -18,6 +21,7 @@ from polybugger_mcp.containers.base import (
     ContainerSecurityError,
 )
 from polybugger_mcp.containers.models import (
+    PROC_SCAN_SCRIPT,
     ContainerInfo,
     ContainerState,
     ExecResult,
@@ -28,6 +32,83 @@ from polybugger_mcp.models.container import ContainerRuntime, ContainerTarget
 
 logger = logging.getLogger(__name__)
 
+# Pod phases, accepted as reported by the API or lowercased
+_PHASE_TO_STATE: dict[str, ContainerState] = {
+    key: state
+    for phase, state in (
+        ("Pending", ContainerState.CREATED),
+        ("Running", ContainerState.RUNNING),
+        ("Succeeded", ContainerState.EXITED),
+        ("Failed", ContainerState.DEAD),
+        ("Unknown", ContainerState.UNKNOWN),
+    )
+    for key in (phase, phase.lower())
+}
+
+# Container status keys, in the order they are checked
+_CONTAINER_STATE_TO_STATE: dict[str, ContainerState] = {
+    "running": ContainerState.RUNNING,
+    "terminated": ContainerState.EXITED,
+    "waiting": ContainerState.CREATED,
+}
+
+# pip invocations tried, in order, when installing debugpy in a pod
+_PIP_INSTALL_DEBUGPY = (
+    "pip install --quiet debugpy",
+    "python -m pip install --quiet debugpy",
+)
+
+# Exit status used by _ENSURE_DEBUGPY when debugpy can't be installed
+_DEBUGPY_INSTALL_FAILED = 97
+
+# Shell snippet that installs debugpy unless it's already importable
+_ENSURE_DEBUGPY = " || ".join(
+    (
+        "python -c 'import debugpy' 2>/dev/null",
+        *_PIP_INSTALL_DEBUGPY,
+        f"exit {_DEBUGPY_INSTALL_FAILED}",
+    )
+)
+
+
+async def _read_forwarding_line(stream: asyncio.StreamReader | None) -> str | None:
+    """Read kubectl port-forward output until it reports a bound listener.
+
+    Returns:
+        The "Forwarding from ..." line, or None if the stream ended first
+    """
+    if stream is None:
+        return None
+    while line := await stream.readline():
+        text = line.decode("utf-8", errors="replace").strip()
+        if text.startswith("Forwarding from"):
+            return text
+    return None
+
+
+async def _drain_output(*streams: asyncio.StreamReader | None) -> None:
+    """Discard kubectl port-forward output for the lifetime of the forward.
+
+    kubectl logs "Handling connection for N" on every accepted connection;
+    if nobody reads the pipe it eventually fills and kubectl blocks.
+    """
+
+    async def drain(stream: asyncio.StreamReader) -> None:
+        while await stream.read(65536):
+            pass
+
+    await asyncio.gather(*(drain(s) for s in streams if s is not None))
+
+
+def _is_not_running_error(stderr: str) -> bool:
+    """Check whether kubectl exec failed because the pod/container isn't running."""
+    stderr_lower = stderr.lower()
+    return (
+        "completed pod" in stderr_lower
+        or "container not found" in stderr_lower
+        or "is not running" in stderr_lower
+    )
+
 
 class KubernetesRuntime(ContainerRuntimeAdapter):
     """Kubernetes container runtime adapter.
@@ -42,8 +123,17 @@ class KubernetesRuntime(ContainerRuntimeAdapter):
             context: Kubernetes context to use (default: current context)
             kubeconfig: Path to kubeconfig file (default: ~/.kube/config)
         """
+        super().__init__()
         self._context = context
         self._kubeconfig = kubeconfig
+
+        # kubectl and its global options, shared by every invocation
+        base_args: list[str] = []
+        if context:
+            base_args.extend(["--context", context])
+        if kubeconfig:
+            base_args.extend(["--kubeconfig", kubeconfig])
+        self._cmd_prefix: tuple[str, ...] = (self.cli_command, *base_args)
         self._port_forwards: dict[str, PortForward] = {}
 
     @property
@@ -56,15 +146,6 @@ class KubernetesRuntime(ContainerRuntimeAdapter):
         """The CLI command for Kubernetes."""
         return "kubectl"
 
-    def _build_base_args(self) -> list[str]:
-        """Build base kubectl arguments."""
-        args = []
-        if self._context:
-            args.extend(["--context", self._context])
-        if self._kubeconfig:
-            args.extend(["--kubeconfig", self._kubeconfig])
-        return args
-
     def _get_pod_identifier(self, target: ContainerTarget) -> tuple[str, str]:
         """Get namespace and pod name from target."""
         namespace = target.namespace or "default"
@@ -107,8 +188,9 @@ class KubernetesRuntime(ContainerRuntimeAdapter):
         Returns:
             ExecResult with stdout, stderr, exit code
         """
-        cmd = [self.cli_command, *self._build_base_args(), *args]
-        logger.debug(f"Running: {' '.join(cmd)}")
+        cmd = [*self._cmd_prefix, *args]
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Running: {' '.join(cmd)}")
 
         try:
             proc = await asyncio.create_subprocess_exec(
@@ -188,32 +270,86 @@ class KubernetesRuntime(ContainerRuntimeAdapter):
                 details={"pod": pod_name},
             )
 
+        return self._parse_pod(data, target)
+
+    async def get_container_infos(self, targets: list[ContainerTarget]) -> list[ContainerInfo]:
+        """Get information for several pods with one kubectl call per namespace.
+
+        Results are returned in the order of ``targets`` and stored in the
+        container info cache.
+        """
+        by_namespace: dict[str, list[str]] = {}
+        for target in targets:
+            namespace, pod_name = self._get_pod_identifier(target)
+            if not pod_name:
+                raise ContainerNotFoundError("(empty)", self.cli_command)
+            pods = by_namespace.setdefault(namespace, [])
+            if pod_name not in pods:
+                pods.append(pod_name)
+
+        pod_data: dict[tuple[str, str], dict[str, Any]] = {}
+        errors: dict[str, str] = {}
+        for namespace, pod_names in by_namespace.items():
+            # kubectl prints the pods it found and reports missing ones on stderr
+            result = await self._run_kubectl(
+                "get", "pods", *pod_names, "-n", namespace, "-o", "json"
+            )
+            errors[namespace] = result.stderr
+            if not result.stdout.strip():
+                continue
+            try:
+                data = json.loads(result.stdout)
+            except json.JSONDecodeError:
+                raise ContainerError(
+                    f"Failed to parse pod info: {result.stdout[:200]}",
+                    details={"pods": pod_names, "namespace": namespace},
+                )
+            items = data.get("items", []) if data.get("kind") == "List" else [data]
+            for item in items:
+                name = item.get("metadata", {}).get("name", "")
+                pod_data[(namespace, name)] = item
+
+        infos: list[ContainerInfo] = []
+        now = time.monotonic()
+        for target in targets:
+            namespace, pod_name = self._get_pod_identifier(target)
+            data = pod_data.get((namespace, pod_name))
+            if data is None:
+                stderr = errors.get(namespace, "")
+                if not stderr or "NotFound" in stderr or "not found" in stderr.lower():
+                    raise ContainerNotFoundError(f"{namespace}/{pod_name}", self.cli_command)
+                raise ContainerError(
+                    f"Failed to get pod info: {stderr}",
+                    details={"pod": pod_name, "namespace": namespace},
+                )
+            info = self._parse_pod(data, target)
+            self._info_cache[target.identifier] = (now, info)
+            infos.append(info)
+
+        return infos
+
+    def _parse_pod(self, data: dict[str, Any], target: ContainerTarget) -> ContainerInfo:
+        """Build ContainerInfo from a parsed pod document."""
+        _, pod_name = self._get_pod_identifier(target)
+
+        status = data.get("status", {})
+
         # Parse phase to state
-        phase = data.get("status", {}).get("phase", "Unknown").lower()
-        state_map = {
-            "pending": ContainerState.CREATED,
-            "running": ContainerState.RUNNING,
-            "succeeded": ContainerState.EXITED,
-            "failed": ContainerState.DEAD,
-            "unknown": ContainerState.UNKNOWN,
-        }
-        state = state_map.get(phase, ContainerState.UNKNOWN)
+        state = _PHASE_TO_STATE.get(status.get("phase", "Unknown"), ContainerState.UNKNOWN)
 
         # Get pod IP
-        ip_address = data.get("status", {}).get("podIP")
+        ip_address = status.get("podIP")
 
         # Get container status if specific container requested
         container_name = target.pod_container
         if container_name:
-            container_statuses = data.get("status", {}).get("containerStatuses", [])
-            for cs in container_statuses:
+            for cs in status.get("containerStatuses", []):
                 if cs.get("name") == container_name:
-                    if cs.get("state", {}).get("running"):
-                        state = ContainerState.RUNNING
-                    elif cs.get("state", {}).get("terminated"):
-                        state = ContainerState.EXITED
-                    elif cs.get("state", {}).get("waiting"):
-                        state = ContainerState.CREATED
+                    container_state = cs.get("state", {})
+                    for key, mapped in _CONTAINER_STATE_TO_STATE.items():
+                        if container_state.get(key):
+                            state = mapped
+                            break
                     break
 
         return ContainerInfo(
@@ -234,16 +370,66 @@ class KubernetesRuntime(ContainerRuntimeAdapter):
         workdir: str | None = None,
         timeout: float = 30.0,
         user: str | None = None,  # noqa: ARG002 - kept for API compatibility
+        verify_running: bool = True,
     ) -> ExecResult:
         """Execute a command inside a pod."""
+        if not env and not workdir:
+            # Nothing for a shell to set up, run the command directly
+            return await self._exec_argv(
+                target, command, timeout=timeout, verify_running=verify_running
+            )
+
+        # kubectl exec doesn't support -w or -e directly, use sh wrapper
+        shell_cmd = shlex.join(command)
+        if env:
+            env_exports = " ".join(f"{k}={shlex.quote(v)}" for k, v in env.items())
+            shell_cmd = f"{env_exports} {shell_cmd}"
+        if workdir:
+            shell_cmd = f"cd {shlex.quote(workdir)} && {shell_cmd}"
+
+        return await self._exec_shell(
+            target, shell_cmd, timeout=timeout, verify_running=verify_running
+        )
+
+    async def _exec_shell(
+        self,
+        target: ContainerTarget,
+        script: str,
+        timeout: float = 30.0,
+        verify_running: bool = True,
+    ) -> ExecResult:
+        """Run a shell script inside a pod with ``sh -c``."""
+        return await self._exec_argv(
+            target, ["sh", "-c", script], timeout=timeout, verify_running=verify_running
+        )
+
+    async def _exec_argv(
+        self,
+        target: ContainerTarget,
+        argv: list[str],
+        timeout: float = 30.0,
+        verify_running: bool = True,
+    ) -> ExecResult:
+        """Run an argument vector inside a pod with ``kubectl exec``.
+
+        Args:
+            target: Container target specification
+            argv: Program and arguments to run
+            timeout: Command timeout in seconds
+            verify_running: Check the pod state before executing
+
+        Returns:
+            ExecResult with stdout, stderr, and exit code
+        """
         namespace, pod_name = self._get_pod_identifier(target)
         if not pod_name:
             raise ContainerNotFoundError("(empty)", self.cli_command)
 
-        # Verify pod is running
-        info = await self.get_container_info(target)
-        if not info.is_running:
-            raise ContainerNotRunningError(f"{namespace}/{pod_name}", info.state.value)
+        # Verify pod is running (a recent lookup is good enough)
+        if verify_running:
+            info = await self.get_cached_container_info(target)
+            if not info.is_running:
+                raise ContainerNotRunningError(f"{namespace}/{pod_name}", info.state.value)
 
         # Build exec command
         args = ["exec", pod_name, "-n", namespace]
@@ -251,17 +437,18 @@ class KubernetesRuntime(ContainerRuntimeAdapter):
         if target.pod_container:
             args.extend(["-c", target.pod_container])
 
-        # kubectl exec doesn't support -w or -e directly, use sh wrapper
-        shell_cmd = " ".join(command)
-        if workdir:
-            shell_cmd = f"cd {workdir} && {shell_cmd}"
-        if env:
-            env_exports = " ".join(f"{k}={v}" for k, v in env.items())
-            shell_cmd = f"{env_exports} {shell_cmd}"
+        args.append("--")
+        args.extend(argv)
 
-        args.extend(["--", "sh", "-c", shell_cmd])
-
-        return await self._run_kubectl(*args, timeout=timeout)
+        result = await self._run_kubectl(*args, timeout=timeout)
+        if not result.success and _is_not_running_error(result.stderr):
+            # Pod or container stopped since it was last looked up
+            self.invalidate_container_info(target)
+            if not verify_running:
+                raise ContainerNotRunningError(
+                    f"{namespace}/{pod_name}", ContainerState.EXITED.value
+                )
+        return result
 
     async def find_python_processes(self, target: ContainerTarget) -> list[ProcessInfo]:
         """Find Python processes in a pod."""
@@ -271,23 +458,29 @@ class KubernetesRuntime(ContainerRuntimeAdapter):
             timeout=10.0,
         )
 
-        if not result.success:
-            # Try alternative
-            result = await self.exec_command(
+        if result.success:
+            parse = ProcessInfo.from_ps_line
+            lines = result.stdout.strip().split("\n")[1:]  # Skip header
+        else:
+            # Minimal images (distroless, alpine) may lack ps, scan /proc instead
+            result = await self._exec_shell(
                 target,
-                ["cat", "/proc/*/cmdline"],
+                PROC_SCAN_SCRIPT,
                 timeout=10.0,
+                verify_running=False,
             )
-
-        if not result.success:
-            logger.warning(f"Failed to list processes: {result.stderr}")
-            return []
+            if not result.success:
+                logger.warning(f"Failed to list processes: {result.stderr}")
+                return []
+            parse = ProcessInfo.from_proc_line
+            lines = result.stdout.split("\n")
 
         processes: list[ProcessInfo] = []
-        lines = result.stdout.strip().split("\n")
-
-        for line in lines[1:]:  # Skip header
-            proc = ProcessInfo.from_ps_line(line)
+        for line in lines:
+            # Most processes aren't Python; skip them before parsing
+            if "python" not in line.lower():
+                continue
+            proc = parse(line)
             if proc and proc.is_python:
                 processes.append(proc)
 
@@ -304,19 +497,12 @@ class KubernetesRuntime(ContainerRuntimeAdapter):
 
     async def install_debugpy(self, target: ContainerTarget) -> None:
         """Install debugpy in the pod."""
-        result = await self.exec_command(
+        result = await self._exec_shell(
             target,
-            ["pip", "install", "--quiet", "debugpy"],
+            " || ".join(_PIP_INSTALL_DEBUGPY),
             timeout=60.0,
         )
 
-        if not result.success:
-            result = await self.exec_command(
-                target,
-                ["python", "-m", "pip", "install", "--quiet", "debugpy"],
-                timeout=60.0,
-            )
-
         if not result.success:
             raise ContainerExecError(
                 "pip install debugpy",
@@ -333,23 +519,16 @@ class KubernetesRuntime(ContainerRuntimeAdapter):
         port: int = 5678,
     ) -> None:
         """Inject debugpy into a running Python process."""
-        if not await self.check_debugpy_installed(target):
-            await self.install_debugpy(target)
-
-        result = await self.exec_command(
+        # Check, install (if needed) and inject in a single exec
+        result = await self._exec_shell(
             target,
-            [
-                "python",
-                "-m",
-                "debugpy",
-                "--listen",
-                f"0.0.0.0:{port}",
-                "--pid",
-                str(process_id),
-            ],
-            timeout=30.0,
+            f"{_ENSURE_DEBUGPY}; exec python -m debugpy --listen 0.0.0.0:{port} --pid {process_id}",
+            timeout=90.0,
         )
 
+        if result.exit_code == _DEBUGPY_INSTALL_FAILED:
+            raise ContainerExecError("pip install debugpy", result.exit_code, result.stderr)
+
         if not result.success:
             stderr_lower = result.stderr.lower()
             if (
@@ -379,6 +558,7 @@ class KubernetesRuntime(ContainerRuntimeAdapter):
                 result.stderr,
             )
 
+        self.invalidate_container_info(target)
         logger.info(f"Injected debugpy into PID {process_id} in pod {target.identifier}")
 
     async def launch_with_debugpy(
@@ -391,9 +571,6 @@ class KubernetesRuntime(ContainerRuntimeAdapter):
         workdir: str | None = None,
     ) -> None:
         """Launch a command with debugpy listening."""
-        if not await self.check_debugpy_installed(target):
-            await self.install_debugpy(target)
-
         debugpy_cmd = [
             "python",
             "-m",
@@ -407,25 +584,21 @@ class KubernetesRuntime(ContainerRuntimeAdapter):
 
         debugpy_cmd.extend(command)
 
-        # Run in background using nohup
-        namespace, pod_name = self._get_pod_identifier(target)
-        args = ["exec", pod_name, "-n", namespace]
-
-        if target.pod_container:
-            args.extend(["-c", target.pod_container])
-
-        # Build command with environment and workdir
-        shell_cmd = " ".join(debugpy_cmd)
+        # Use nohup to run in background. Exports and cd are shell builtins,
+        # so they go before nohup rather than being passed to it.
+        launch = f"nohup {shlex.join(debugpy_cmd)} > /dev/null 2>&1 &"
         if workdir:
-            shell_cmd = f"cd {workdir} && {shell_cmd}"
+            launch = f"cd {shlex.quote(workdir)} && {launch}"
+        script = [_ENSURE_DEBUGPY]
         if env:
-            env_exports = " ".join(f"export {k}={v};" for k, v in env.items())
-            shell_cmd = f"{env_exports} {shell_cmd}"
+            script.extend(f"export {k}={shlex.quote(v)}" for k, v in env.items())
+        script.append(launch)
 
-        # Use nohup to run in background
-        args.extend(["--", "sh", "-c", f"nohup {shell_cmd} > /dev/null 2>&1 &"])
+        # Install (if needed) and launch in a single exec
+        result = await self._exec_shell(target, "; ".join(script), timeout=70.0)
 
-        result = await self._run_kubectl(*args, timeout=10.0)
+        if result.exit_code == _DEBUGPY_INSTALL_FAILED:
+            raise ContainerExecError("pip install debugpy", result.exit_code, result.stderr)
 
         if not result.success:
             raise ContainerExecError(
@@ -434,6 +607,7 @@ class KubernetesRuntime(ContainerRuntimeAdapter):
                 result.stderr,
             )
 
+        self.invalidate_container_info(target)
         logger.info(f"Launched debugpy in pod {target.identifier} on port {port}")
 
     async def get_debugpy_endpoint(
@@ -450,25 +624,20 @@ class KubernetesRuntime(ContainerRuntimeAdapter):
             pf = self._port_forwards[key]
             return ("127.0.0.1", pf.local_port)
 
-        # Create new port-forward
-        import socket
-
-        # Get a free local port
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            s.bind(("127.0.0.1", 0))
-            local_port = s.getsockname()[1]
-
+        # Create new port-forward; kubectl picks a free local port itself,
+        # avoiding the race of probing for one and handing it over
         cmd = [
-            self.cli_command,
-            *self._build_base_args(),
+            *self._cmd_prefix,
             "port-forward",
             f"pod/{pod_name}",
             "-n",
             namespace,
-            f"{local_port}:{container_port}",
+            "--address",
+            "127.0.0.1",
+            f":{container_port}",
         ]
 
-        logger.info(f"Starting port-forward: localhost:{local_port} -> {pod_name}:{container_port}")
+        logger.info(f"Starting port-forward: localhost -> {pod_name}:{container_port}")
 
         proc = await asyncio.create_subprocess_exec(
             *cmd,
@@ -476,46 +645,59 @@ class KubernetesRuntime(ContainerRuntimeAdapter):
             stderr=asyncio.subprocess.PIPE,
         )
 
-        pf = PortForward(
-            local_port=local_port,
-            remote_port=container_port,
-            process=proc,
-        )
-
-        # Wait for port-forward to be ready
-        start = asyncio.get_event_loop().time()
-        while asyncio.get_event_loop().time() - start < 10.0:
-            try:
-                reader, writer = await asyncio.wait_for(
-                    asyncio.open_connection("127.0.0.1", local_port),
-                    timeout=1.0,
-                )
-                writer.close()
-                await writer.wait_closed()
-                break
-            except (ConnectionRefusedError, asyncio.TimeoutError, OSError):
-                if proc.returncode is not None:
-                    stderr = ""
-                    if proc.stderr:
-                        stderr_bytes = await proc.stderr.read()
-                        stderr = stderr_bytes.decode()[:500]
-                    raise ContainerError(
-                        f"Port-forward failed: {stderr}",
-                        details={"pod": pod_name, "port": container_port},
-                    )
-                await asyncio.sleep(0.2)
-        else:
+        # Wait for kubectl to report the listener is bound
+        try:
+            forwarding = await asyncio.wait_for(_read_forwarding_line(proc.stdout), timeout=10.0)
+        except asyncio.TimeoutError:
             proc.kill()
+            await proc.wait()
             raise ContainerError(
                 "Port-forward timeout",
                 details={"pod": pod_name, "port": container_port},
             )
 
-        self._port_forwards[key] = pf
+        if forwarding is None:
+            # stdout closed without a listener: kubectl is exiting
+            stderr = ""
+            if proc.stderr:
+                stderr_bytes = await proc.stderr.read()
+                stderr = stderr_bytes.decode("utf-8", errors="replace")[:500]
+            await proc.wait()
+            raise ContainerError(
+                f"Port-forward failed: {stderr}",
+                details={"pod": pod_name, "port": container_port},
+            )
+
+        # e.g. "Forwarding from 127.0.0.1:45678 -> 5678"
+        try:
+            local_port = int(forwarding.split()[2].rpartition(":")[2])
+        except (IndexError, ValueError):
+            proc.kill()
+            await proc.wait()
+            raise ContainerError(
+                f"Unexpected port-forward output: {forwarding}",
+                details={"pod": pod_name, "port": container_port},
+            )
+
+        logger.info(f"Port-forward ready: localhost:{local_port} -> {pod_name}:{container_port}")
+
+        self._port_forwards[key] = PortForward(
+            local_port=local_port,
+            remote_port=container_port,
+            process=proc,
+            output_reader=asyncio.create_task(_drain_output(proc.stdout, proc.stderr)),
+        )
         return ("127.0.0.1", local_port)
 
     async def cleanup_port_forwards(self) -> None:
         """Close all active port-forwards."""
-        for pf in self._port_forwards.values():
-            await pf.close()
+        # Each close waits up to 5s for kubectl to exit, so close them together
+        port_forwards = list(self._port_forwards.items())
         self._port_forwards.clear()
+        results = await asyncio.gather(
+            *(pf.close() for _, pf in port_forwards),
+            return_exceptions=True,
+        )
+        for (key, _), result in zip(port_forwards, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to close port-forward {key}: {result}")
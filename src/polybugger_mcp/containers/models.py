@@ -96,6 +96,45 @@ class ProcessInfo:
         except (ValueError, IndexError):
             return None
 
+    @classmethod
+    def from_proc_line(cls, line: str) -> "ProcessInfo | None":
+        """Parse a process from a PROC_SCAN_SCRIPT output line.
+
+        Expected format: PID<TAB>COMM<TAB>CMDLINE
+        """
+        parts = line.split("\t", 2)
+        if len(parts) < 3:
+            return None
+
+        try:
+            pid = int(parts[0])
+        except ValueError:
+            return None
+
+        name = parts[1]
+        cmdline = parts[2].strip() or name
+        # comm is the script name for console-script/shebang launches
+        # (e.g. gunicorn), so also check the interpreter in argv[0]
+        exe = cmdline.split()[0].split("/")[-1]
+        is_python = (
+            "python" in name.lower() or "python" in exe.lower() or cmdline.startswith("python")
+        )
+
+        return cls(pid=pid, name=name, cmdline=cmdline, is_python=is_python)
+
+
+# Shell script listing processes from /proc for containers without ps.
+# Emits one PID<TAB>COMM<TAB>CMDLINE line per process.
+PROC_SCAN_SCRIPT = (
+    "for p in /proc/[0-9]*; do "
+    'printf "%s\\t" "${p#/proc/}"; '
+    'tr -d "\\n" < "$p/comm" 2>/dev/null; '
+    'printf "\\t"; '
+    'tr "\\0" " " < "$p/cmdline" 2>/dev/null; '
+    'printf "\\n"; '
+    "done"
+)
+
 
 @dataclass
 class ExecResult:
@@ -119,6 +158,7 @@ class PortForward:
     local_port: int
     remote_port: int
     process: object | None = None  # asyncio.subprocess.Process
+    output_reader: object | None = field(default=None, repr=False)  # asyncio.Task
     _closed: bool = field(default=False, repr=False)
 
     @property
@@ -149,3 +189,6 @@ class PortForward:
                 await self.process.wait()  # type: ignore
             except (ProcessLookupError, AttributeError):
                 pass
+
+        if self.output_reader is not None:
+            self.output_reader.cancel()  # type: ignore
@@ -9,6 +9,7 @@ import logging
 import os
 import shutil
 import socket
+from collections import deque
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -16,6 +17,27 @@ from polybugger_mcp.models.container import SSHConfig
 
 logger = logging.getLogger(__name__)
 
+# ssh -v prints this once the -L listener is bound
+_FORWARD_LISTENING = "Local forwarding listening on"
+
+# Options shared by every tunnel's ssh command line
+_BASE_SSH_OPTS = (
+    "-N",  # Don't execute remote command
+    "-v",  # Report when the forward is listening (see SSHTunnel.wait_ready)
+    "-o",
+    "StrictHostKeyChecking=accept-new",  # Accept new host keys
+    "-o",
+    "BatchMode=yes",  # Non-interactive mode
+    "-o",
+    "ExitOnForwardFailure=yes",  # Fail fast if the local port can't be bound
+    "-o",
+    "ConnectTimeout=10",
+    "-o",
+    "ServerAliveInterval=30",
+    "-o",
+    "ServerAliveCountMax=3",
+)
+
 
 class SSHTunnelError(Exception):
     """Raised when SSH tunnel operations fail."""
@@ -27,7 +49,12 @@ class SSHTunnelError(Exception):
 
 
 def _get_free_port() -> int:
-    """Get an available local port."""
+    """Get an available local port.
+
+    The port is released before ssh binds it; if another process takes it
+    in between, ExitOnForwardFailure makes ssh exit immediately rather than
+    hang.
+    """
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
         s.bind(("127.0.0.1", 0))
         port: int = s.getsockname()[1]
@@ -45,6 +72,24 @@ class SSHTunnel:
     ssh_user: str
     process: asyncio.subprocess.Process | None = None
     _closed: bool = field(default=False, repr=False)
+    _ready: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+    _stderr_lines: deque[str] = field(default_factory=lambda: deque(maxlen=200), repr=False)
+    _stderr_reader: asyncio.Task[None] | None = field(default=None, repr=False)
+
+    def __post_init__(self) -> None:
+        # ssh runs with -v, so stderr must be drained for the tunnel's lifetime
+        if self.process is not None and self.process.stderr is not None:
+            self._stderr_reader = asyncio.get_running_loop().create_task(
+                self._read_stderr(self.process.stderr)
+            )
+
+    async def _read_stderr(self, stream: asyncio.StreamReader) -> None:
+        """Collect ssh diagnostics and flag when the local forward is listening."""
+        while line := await stream.readline():
+            text = line.decode("utf-8", errors="replace").rstrip()
+            self._stderr_lines.append(text)
+            if _FORWARD_LISTENING in text:
+                self._ready.set()
 
     @property
     def is_active(self) -> bool:
@@ -60,30 +105,59 @@ class SSHTunnel:
         """Get the local endpoint to connect to."""
         return f"127.0.0.1:{self.local_port}"
 
+    @property
+    def error_output(self) -> str:
+        """Recent ssh stderr, without its -v debug lines."""
+        return "\n".join(line for line in self._stderr_lines if not line.startswith("debug"))
+
     async def wait_ready(self, timeout: float = 10.0) -> bool:
         """Wait for the tunnel to be ready for connections.
 
+        Readiness is reported by ssh itself once the local listener is bound.
+
         Args:
             timeout: Maximum time to wait in seconds
 
         Returns:
             True if tunnel is ready, False if timeout reached
         """
-        start = asyncio.get_event_loop().time()
-        while asyncio.get_event_loop().time() - start < timeout:
+        if self._stderr_reader is None:
+            return await self._probe()
+
+        ready = asyncio.ensure_future(self._ready.wait())
+        try:
+            await asyncio.wait(
+                {ready, self._stderr_reader},
+                timeout=timeout,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        finally:
+            ready.cancel()
+
+        if self._ready.is_set():
+            return True
+        if self._stderr_reader.done():
+            # stderr closed without a listener: ssh is exiting
+            if self.process is not None:
+                await self.process.wait()
+            return False
+
+        # ssh didn't confirm in time; its output may be filtered by local config
+        return await self._probe()
+
+    async def _probe(self) -> bool:
+        """Check once whether the local port accepts connections."""
+        loop = asyncio.get_running_loop()
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.setblocking(False)
             try:
-                # Try to connect to the local port
-                reader, writer = await asyncio.wait_for(
-                    asyncio.open_connection("127.0.0.1", self.local_port),
+                await asyncio.wait_for(
+                    loop.sock_connect(sock, ("127.0.0.1", self.local_port)),
                     timeout=1.0,
                 )
-                writer.close()
-                await writer.wait_closed()
-                return True
-            except (ConnectionRefusedError, asyncio.TimeoutError, OSError):
-                await asyncio.sleep(0.2)
-
-        return False
+            except (asyncio.TimeoutError, OSError):
+                return False
+        return True
 
     async def close(self) -> None:
         """Close the SSH tunnel."""
@@ -102,6 +176,9 @@ class SSHTunnel:
             except ProcessLookupError:
                 pass  # Already terminated
 
+            if self._stderr_reader is not None:
+                self._stderr_reader.cancel()
+
             logger.info(
                 f"SSH tunnel closed: localhost:{self.local_port} -> "
                 f"{self.ssh_user}@{self.ssh_host} -> {self.remote_host}:{self.remote_port}"
@@ -114,10 +191,36 @@ class SSHTunnelManager:
     def __init__(self) -> None:
         self._tunnels: dict[str, SSHTunnel] = {}
         self._lock = asyncio.Lock()
+        self._ssh_cmd: str | None = None
+        self._no_askpass_env: dict[str, str] | None = None
+        self._pending: dict[str, asyncio.Future[SSHTunnel]] = {}
 
     def _get_ssh_command(self) -> str | None:
-        """Find the SSH command on the system."""
-        return shutil.which("ssh")
+        """Find the SSH command on the system.
+
+        A successful lookup is remembered; a missing client is looked up
+        again next time in case it has since been installed.
+        """
+        if self._ssh_cmd is None:
+            self._ssh_cmd = shutil.which("ssh")
+        return self._ssh_cmd
+
+    def refresh_ssh_path(self) -> None:
+        """Forget the remembered SSH client path."""
+        self._ssh_cmd = None
+
+    def _get_no_askpass_env(self) -> dict[str, str]:
+        """Get the server environment with SSH password prompts disabled.
+
+        Built from os.environ on first use and reused for later tunnels.
+        """
+        if self._no_askpass_env is None:
+            self._no_askpass_env = {
+                **os.environ,
+                "SSH_ASKPASS": "",
+                "SSH_ASKPASS_REQUIRE": "never",
+            }
+        return self._no_askpass_env
 
     def _tunnel_key(self, ssh_host: str, remote_host: str, remote_port: int) -> str:
         """Generate a unique key for a tunnel."""
@@ -144,6 +247,33 @@ class SSHTunnelManager:
         Raises:
             SSHTunnelError: If tunnel creation fails
         """
+        # Reuse an existing tunnel for this target; reads don't need the lock
+        key = self._tunnel_key(ssh_config.host, remote_host, remote_port)
+        existing = self._tunnels.get(key)
+        if existing is not None and existing.is_active:
+            return existing
+
+        # Concurrent requests for the same target share one ssh process. The
+        # check and insert don't await, so no lock is needed; shield keeps a
+        # cancelled caller from cancelling the start for the others.
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(
+                self._start_tunnel(key, ssh_config, remote_host, remote_port, local_port)
+            )
+            self._pending[key] = pending
+            pending.add_done_callback(lambda _: self._pending.pop(key, None))
+        return await asyncio.shield(pending)
+
+    async def _start_tunnel(
+        self,
+        key: str,
+        ssh_config: SSHConfig,
+        remote_host: str,
+        remote_port: int,
+        local_port: int | None,
+    ) -> SSHTunnel:
+        """Start ssh for a new tunnel and register it once ready."""
         ssh_cmd = self._get_ssh_command()
         if not ssh_cmd:
             raise SSHTunnelError(
@@ -151,12 +281,6 @@ class SSHTunnelManager:
                 {"hint": "Install OpenSSH client (e.g., 'apt install openssh-client')"},
             )
 
-        # Check if we already have a tunnel for this target
-        key = self._tunnel_key(ssh_config.host, remote_host, remote_port)
-        async with self._lock:
-            if key in self._tunnels and self._tunnels[key].is_active:
-                return self._tunnels[key]
-
         # Get a free local port if not specified
         if local_port is None:
             local_port = _get_free_port()
@@ -164,19 +288,9 @@ class SSHTunnelManager:
         # Build SSH command
         cmd = [
             ssh_cmd,
-            "-N",  # Don't execute remote command
+            *_BASE_SSH_OPTS,
             "-L",
             f"{local_port}:{remote_host}:{remote_port}",  # Local port forward
-            "-o",
-            "StrictHostKeyChecking=accept-new",  # Accept new host keys
-            "-o",
-            "BatchMode=yes",  # Non-interactive mode
-            "-o",
-            "ConnectTimeout=10",
-            "-o",
-            "ServerAliveInterval=30",
-            "-o",
-            "ServerAliveCountMax=3",
             "-p",
             str(ssh_config.port),
         ]
@@ -212,16 +326,16 @@ class SSHTunnelManager:
         )
 
         try:
-            env = os.environ.copy()
             # Disable SSH password prompt if no key is provided
+            env = None
             if not ssh_config.key_path and not ssh_config.password:
-                env["SSH_ASKPASS"] = ""
-                env["SSH_ASKPASS_REQUIRE"] = "never"
+                env = self._get_no_askpass_env()
 
             process = await asyncio.create_subprocess_exec(
                 *cmd,
                 stdin=asyncio.subprocess.DEVNULL,
-                stdout=asyncio.subprocess.PIPE,
+                # stdout is never read; stderr is drained by SSHTunnel's reader
+                stdout=asyncio.subprocess.DEVNULL,
                 stderr=asyncio.subprocess.PIPE,
                 env=env,
             )
@@ -238,12 +352,11 @@ class SSHTunnelManager:
             # Wait for tunnel to be ready
             ready = await tunnel.wait_ready(timeout=15.0)
             if not ready:
-                # Check if process died
-                if process.returncode is not None:
-                    stderr = ""
-                    if process.stderr:
-                        stderr_bytes = await process.stderr.read()
-                        stderr = stderr_bytes.decode()[:500]
+                # Check if process died, then make sure it doesn't linger
+                exited = process.returncode is not None
+                await tunnel.close()
+                if exited:
+                    stderr = tunnel.error_output[:500]
                     raise SSHTunnelError(
                         f"SSH tunnel failed to start: {stderr}",
                         {
@@ -286,11 +399,10 @@ class SSHTunnelManager:
             SSHTunnel if exists and active, None otherwise
         """
         key = self._tunnel_key(ssh_host, remote_host, remote_port)
-        async with self._lock:
-            tunnel = self._tunnels.get(key)
-            if tunnel and tunnel.is_active:
-                return tunnel
-            return None
+        tunnel = self._tunnels.get(key)
+        if tunnel and tunnel.is_active:
+            return tunnel
+        return None
 
     async def close_tunnel(self, ssh_host: str, remote_host: str, remote_port: int) -> bool:
         """Close a specific tunnel.
@@ -306,10 +418,10 @@ class SSHTunnelManager:
         key = self._tunnel_key(ssh_host, remote_host, remote_port)
         async with self._lock:
             tunnel = self._tunnels.pop(key, None)
-            if tunnel:
-                await tunnel.close()
-                return True
-            return False
+        if tunnel:
+            await tunnel.close()
+            return True
+        return False
 
     async def close_all(self) -> int:
         """Close all active tunnels.
@@ -318,12 +430,12 @@ class SSHTunnelManager:
             Number of tunnels closed
         """
         async with self._lock:
-            count = 0
-            for tunnel in self._tunnels.values():
-                await tunnel.close()
-                count += 1
+            tunnels = list(self._tunnels.values())
             self._tunnels.clear()
-            return count
+
+        # Each close may wait several seconds for ssh to exit; run them together
+        await asyncio.gather(*(t.close() for t in tunnels), return_exceptions=True)
+        return len(tunnels)
 
     @property
     def active_count(self) -> int:
@@ -2,7 +2,9 @@
 
 import asyncio
 import contextlib
+from collections import deque
 from datetime import datetime, timezone
+from itertools import groupby
 from typing import Any
 
 from polybugger_mcp.models.events import DebugEvent, EventType
@@ -23,8 +25,7 @@ class EventQueue:
             max_history: Number of events to keep in history
         """
         self._queue: asyncio.Queue[DebugEvent] = asyncio.Queue(maxsize=max_size)
-        self._history: list[DebugEvent] = []
-        self._max_history = max_history
+        self._history: deque[DebugEvent] = deque(maxlen=max_history)
         self._event_counter = 0
 
     async def put(self, event_type: EventType, data: dict[str, Any]) -> None:
@@ -48,10 +49,8 @@ class EventQueue:
                 self._queue.get_nowait()
             self._queue.put_nowait(event)
 
-        # Add to history
+        # Add to history (the deque drops the oldest entry itself)
         self._history.append(event)
-        if len(self._history) > self._max_history:
-            self._history.pop(0)
 
         self._event_counter += 1
 
@@ -71,7 +70,11 @@ class EventQueue:
         except (asyncio.TimeoutError, asyncio.QueueEmpty):
             return None
 
-    async def get_all(self, timeout: float | None = None) -> list[DebugEvent]:
+    async def get_all(
+        self,
+        timeout: float | None = None,
+        coalesce_output: bool = False,
+    ) -> list[DebugEvent]:
         """Get all pending events.
 
         If timeout is specified and no events are pending, waits up to
@@ -79,35 +82,35 @@ class EventQueue:
 
         Args:
             timeout: Seconds to wait if queue is empty (long-polling)
+            coalesce_output: Merge consecutive output events of the same
+                category into one (see coalesce_output_events)
 
         Returns:
             List of all pending events
         """
-        events: list[DebugEvent] = []
-
         # First, drain any existing events
-        while True:
-            try:
-                events.append(self._queue.get_nowait())
-            except asyncio.QueueEmpty:
-                break
+        events = self._drain()
 
-        # If no events and timeout specified, wait for one
+        # If no events and timeout specified, return as soon as one arrives
         if not events and timeout:
-            try:
-                event = await asyncio.wait_for(self._queue.get(), timeout=timeout)
-                events.append(event)
-                # Drain any additional events that arrived
-                while True:
-                    try:
-                        events.append(self._queue.get_nowait())
-                    except asyncio.QueueEmpty:
-                        break
-            except asyncio.TimeoutError:
-                pass
+            with contextlib.suppress(asyncio.TimeoutError):
+                events.append(await asyncio.wait_for(self._queue.get(), timeout=timeout))
+                # Include anything that arrived alongside it
+                events.extend(self._drain())
 
+        if coalesce_output:
+            return coalesce_output_events(events)
         return events
 
+    def _drain(self) -> list[DebugEvent]:
+        """Take every event currently in the queue without waiting."""
+        events: list[DebugEvent] = []
+        while True:
+            try:
+                events.append(self._queue.get_nowait())
+            except asyncio.QueueEmpty:
+                return events
+
     def clear(self) -> None:
         """Clear all pending events."""
         while not self._queue.empty():
@@ -132,3 +135,45 @@ class EventQueue:
     def history(self) -> list[DebugEvent]:
         """Recent event history (read-only copy)."""
         return list(self._history)
+
+
+def _output_run_key(event: DebugEvent) -> tuple[bool, Any]:
+    """Group key joining consecutive output events of one category."""
+    if event.type == EventType.OUTPUT:
+        return (True, event.data.get("category"))
+    return (False, id(event))
+
+
+def coalesce_output_events(events: list[DebugEvent]) -> list[DebugEvent]:
+    """Merge runs of consecutive same-category output events.
+
+    A merged event keeps the first event's timestamp and data, with
+    "output" holding the concatenated text and "count" the number of
+    events merged. Single events and all other event types are returned
+    unchanged, in order.
+
+    Args:
+        events: Events in the order they were received
+
+    Returns:
+        Events with output runs merged
+    """
+    coalesced: list[DebugEvent] = []
+    for _, group in groupby(events, key=_output_run_key):
+        run = list(group)
+        if len(run) == 1:
+            coalesced.append(run[0])
+            continue
+        first = run[0]
+        coalesced.append(
+            DebugEvent(
+                type=first.type,
+                timestamp=first.timestamp,
+                data={
+                    **first.data,
+                    "output": "".join(e.data.get("output", "") for e in run),
+                    "count": len(run),
+                },
+            )
+        )
+    return coalesced
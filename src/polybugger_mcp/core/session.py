@@ -85,9 +85,22 @@ class Session:
 
         # Breakpoints (file path -> list of breakpoints)
         self._breakpoints: dict[str, list[SourceBreakpoint]] = {}
+        # Serialized breakpoints per file, keyed by the list they were built from
+        self._breakpoint_summaries: dict[
+            str, tuple[list[SourceBreakpoint], list[dict[str, Any]]]
+        ] = {}
 
-        # Watch expressions (evaluated on each stop)
-        self._watch_expressions: list[str] = []
+        # Stack traces and scopes for the current stop. DAP frame ids are only
+        # valid while stopped, so these are dropped whenever execution moves.
+        self._frame_generation = 0
+        self._stack_trace_cache: dict[tuple[int, int, int], list[StackFrame]] = {}
+        self._scopes_cache: dict[int, list[Scope]] = {}
+
+        # Watch expressions (evaluated on each stop), in the order added
+        self._watch_expressions: dict[str, None] = {}
+
+        # debug_list_sessions summary and the (state, stop_reason) it reflects
+        self._summary: tuple[tuple[SessionState, str | None], dict[str, Any]] | None = None
 
     @property
     def state(self) -> SessionState:
@@ -125,9 +138,16 @@ class Session:
                     )
 
             self._state = new_state
+            self._invalidate_frame_caches()
             self.last_activity = datetime.now(timezone.utc)
             logger.info(f"Session {self.id}: state -> {new_state.value}")
 
+    def _invalidate_frame_caches(self) -> None:
+        """Forget stack traces and scopes from the previous stop."""
+        self._frame_generation += 1
+        self._stack_trace_cache.clear()
+        self._scopes_cache.clear()
+
     def require_state(self, *states: SessionState) -> None:
         """Raise if not in one of the required states."""
         if self._state not in states:
@@ -218,6 +238,37 @@ class Session:
             Breakpoint(verified=False, line=bp.line, message="Pending launch") for bp in breakpoints
         ]
 
+    def get_breakpoints_summary(self) -> dict[str, list[dict[str, Any]]]:
+        """Get all breakpoints as plain dicts, organized by file.
+
+        Breakpoint lists are replaced rather than mutated when a file's
+        breakpoints change, so a file's serialized form is reused until its
+        list is replaced.
+
+        Returns:
+            Mapping of file path to breakpoint line, condition, hit condition
+            and log message
+        """
+        summaries: dict[str, tuple[list[SourceBreakpoint], list[dict[str, Any]]]] = {}
+        for path, bps in self._breakpoints.items():
+            cached = self._breakpoint_summaries.get(path)
+            if cached is None or cached[0] is not bps:
+                cached = (
+                    bps,
+                    [
+                        {
+                            "line": bp.line,
+                            "condition": bp.condition,
+                            "hit_condition": bp.hit_condition,
+                            "log_message": bp.log_message,
+                        }
+                        for bp in bps
+                    ],
+                )
+            summaries[path] = cached
+        self._breakpoint_summaries = summaries
+        return {path: serialized for path, (_, serialized) in summaries.items()}
+
     async def continue_(self, thread_id: int | None = None) -> None:
         """Continue execution."""
         self.require_state(SessionState.PAUSED)
@@ -286,13 +337,31 @@ class Session:
             return []
 
         tid = thread_id or self.current_thread_id or 1
-        return await self.adapter.get_stack_trace(tid, start_frame, levels)
+        key = (tid, start_frame, levels)
+        cached = self._stack_trace_cache.get(key)
+        if cached is not None:
+            return cached
+
+        generation = self._frame_generation
+        frames = await self.adapter.get_stack_trace(tid, start_frame, levels)
+        if self._state == SessionState.PAUSED and generation == self._frame_generation:
+            self._stack_trace_cache[key] = frames
+        return frames
 
     async def get_scopes(self, frame_id: int) -> list[Scope]:
         """Get scopes for a frame."""
         if self.adapter is None:
             return []
-        return await self.adapter.get_scopes(frame_id)
+
+        cached = self._scopes_cache.get(frame_id)
+        if cached is not None:
+            return cached
+
+        generation = self._frame_generation
+        scopes = await self.adapter.get_scopes(frame_id)
+        if self._state == SessionState.PAUSED and generation == self._frame_generation:
+            self._scopes_cache[frame_id] = scopes
+        return scopes
 
     async def get_variables(
         self,
@@ -338,9 +407,8 @@ class Session:
             Current list of watch expressions
         """
         self.touch()
-        if expression not in self._watch_expressions:
-            self._watch_expressions.append(expression)
-        return self._watch_expressions.copy()
+        self._watch_expressions.setdefault(expression)
+        return list(self._watch_expressions)
 
     def remove_watch(self, expression: str) -> list[str]:
         """Remove a watch expression.
@@ -352,9 +420,8 @@ class Session:
             Current list of watch expressions
         """
         self.touch()
-        if expression in self._watch_expressions:
-            self._watch_expressions.remove(expression)
-        return self._watch_expressions.copy()
+        self._watch_expressions.pop(expression, None)
+        return list(self._watch_expressions)
 
     def list_watches(self) -> list[str]:
         """Get all watch expressions.
@@ -362,7 +429,7 @@ class Session:
         Returns:
             List of watch expressions
         """
-        return self._watch_expressions.copy()
+        return list(self._watch_expressions)
 
     def clear_watches(self) -> None:
         """Clear all watch expressions."""
@@ -384,30 +451,39 @@ class Session:
         if not self.adapter or self._state != SessionState.PAUSED:
             return []
 
-        results: list[dict[str, Any]] = []
-        for expr in self._watch_expressions:
-            try:
-                result = await self.adapter.evaluate(expr, frame_id, "watch")
-                results.append(
-                    {
-                        "expression": expr,
-                        "result": result.get("result", ""),
-                        "type": result.get("type"),
-                        "variables_reference": result.get("variablesReference", 0),
-                        "error": None,
-                    }
-                )
-            except Exception as e:
-                results.append(
-                    {
-                        "expression": expr,
-                        "result": None,
-                        "type": None,
-                        "variables_reference": 0,
-                        "error": str(e),
-                    }
+        # Send every watch request before awaiting any reply; the DAP client
+        # matches responses by seq, so they share one connection
+        return list(
+            await asyncio.gather(
+                *(
+                    self._evaluate_watch(self.adapter, expr, frame_id)
+                    for expr in self._watch_expressions
                 )
-        return results
+            )
+        )
+
+    @staticmethod
+    async def _evaluate_watch(
+        adapter: DebugAdapter, expr: str, frame_id: int | None
+    ) -> dict[str, Any]:
+        """Evaluate one watch expression, reporting failures in the result."""
+        try:
+            result = await adapter.evaluate(expr, frame_id, "watch")
+        except Exception as e:
+            return {
+                "expression": expr,
+                "result": None,
+                "type": None,
+                "variables_reference": 0,
+                "error": str(e),
+            }
+        return {
+            "expression": expr,
+            "result": result.get("result", ""),
+            "type": result.get("type"),
+            "variables_reference": result.get("variablesReference", 0),
+            "error": None,
+        }
 
     # Smart inspection methods
 
@@ -561,7 +637,7 @@ class Session:
             breakpoints={
                 path: [bp.model_dump() for bp in bps] for path, bps in self._breakpoints.items()
             },
-            watch_expressions=self._watch_expressions.copy(),
+            watch_expressions=list(self._watch_expressions),
             saved_at=datetime.now(timezone.utc),
             server_shutdown=server_shutdown,
         )
@@ -592,7 +668,7 @@ class Session:
             session._breakpoints[path] = [SourceBreakpoint(**bp) for bp in bps]
 
         # Restore watch expressions
-        session._watch_expressions = data.watch_expressions.copy()
+        session._watch_expressions = dict.fromkeys(data.watch_expressions)
 
         return session
 
@@ -604,6 +680,15 @@ class Session:
         """Handle debug events from debugpy."""
         await self.event_queue.put(event_type, data)
 
+        if event_type in (
+            EventType.STOPPED,
+            EventType.CONTINUED,
+            EventType.TERMINATED,
+            EventType.EXITED,
+        ):
+            # Another thread stopping while already paused is not a transition
+            self._invalidate_frame_caches()
+
         if event_type == EventType.STOPPED:
             self.current_thread_id = data.get("threadId")
             self.stop_reason = data.get("reason")
@@ -621,6 +706,28 @@ class Session:
             with contextlib.suppress(InvalidSessionStateError):
                 await self.transition_to(SessionState.TERMINATED)
 
+    def get_summary(self) -> dict[str, Any]:
+        """Get a short description of the session for session listings.
+
+        Only the state and stop reason change over a session's lifetime, so
+        the dict is rebuilt only when one of them has.
+        """
+        key = (self._state, self.stop_reason)
+        if self._summary is None or self._summary[0] != key:
+            self._summary = (
+                key,
+                {
+                    "session_id": self.id,
+                    "name": self.name,
+                    "project_root": str(self.project_root),
+                    "language": self.language,
+                    "python_path": self.python_path,
+                    "state": self._state.value,
+                    "stop_reason": self.stop_reason,
+                },
+            )
+        return self._summary[1]
+
     def to_info(self) -> SessionInfo:
         """Convert to API response model."""
         return SessionInfo(
@@ -12,8 +12,11 @@ Usage:
     python-debugger-mcp-server
 """
 
+import asyncio
 import logging
+from collections.abc import Iterable, Iterator
 from contextlib import asynccontextmanager
+from itertools import chain, repeat
 from typing import Any
 
 from mcp.server.fastmcp import FastMCP
@@ -24,7 +27,15 @@ from polybugger_mcp.core.exceptions import (
     SessionNotFoundError,
 )
 from polybugger_mcp.core.session import SessionManager
-from polybugger_mcp.models.dap import AttachConfig, LaunchConfig, PathMapping, SourceBreakpoint
+from polybugger_mcp.models.dap import (
+    AttachConfig,
+    LaunchConfig,
+    PathMapping,
+    Scope,
+    SourceBreakpoint,
+    StackFrame,
+    Variable,
+)
 from polybugger_mcp.models.session import SessionConfig
 from polybugger_mcp.utils.tui_formatter import TUIFormatter
 
@@ -36,6 +47,13 @@ _session_manager: SessionManager | None = None
 # Global TUI formatter instance
 _tui_formatter: TUIFormatter | None = None
 
+# debug_step mode -> Session method name
+_STEP_METHODS: dict[str, str] = {
+    "over": "step_over",
+    "into": "step_into",
+    "out": "step_out",
+}
+
 
 def _get_formatter() -> TUIFormatter:
     """Get the TUI formatter, creating if needed."""
@@ -74,6 +92,51 @@ def _get_manager() -> SessionManager:
     return _session_manager
 
 
+def _padded(values: Iterable[str | None] | None) -> Iterator[str | None]:
+    """Yield the given per-line options followed by None indefinitely."""
+    return chain(values or (), repeat(None))
+
+
+def _frames_to_dicts(frames: list[StackFrame]) -> list[dict[str, Any]]:
+    """Convert stack frames to tool response dicts."""
+    return [
+        {
+            "id": f.id,
+            "name": f.name,
+            "file": f.source.path if f.source else None,
+            "line": f.line,
+            "column": f.column,
+        }
+        for f in frames
+    ]
+
+
+def _scopes_to_dicts(scopes: list[Scope]) -> list[dict[str, Any]]:
+    """Convert scopes to tool response dicts."""
+    return [
+        {
+            "name": s.name,
+            "variables_reference": s.variables_reference,
+            "expensive": s.expensive,
+        }
+        for s in scopes
+    ]
+
+
+def _variables_to_dicts(variables: list[Variable]) -> list[dict[str, Any]]:
+    """Convert variables to tool response dicts."""
+    return [
+        {
+            "name": v.name,
+            "value": v.value,
+            "type": v.type,
+            "variables_reference": v.variables_reference,
+            "has_children": v.variables_reference > 0,
+        }
+        for v in variables
+    ]
+
+
 # =============================================================================
 # Session Management Tools
 # =============================================================================
@@ -151,18 +214,7 @@ async def debug_list_sessions() -> dict[str, Any]:
     manager = _get_manager()
     sessions = await manager.list_sessions()
     return {
-        "sessions": [
-            {
-                "session_id": s.id,
-                "name": s.name,
-                "project_root": str(s.project_root),
-                "language": s.language,
-                "python_path": s.python_path,
-                "state": s.state.value,
-                "stop_reason": s.stop_reason,
-            }
-            for s in sessions
-        ],
+        "sessions": [s.get_summary() for s in sessions],
         "total": len(sessions),
     }
 
@@ -230,26 +282,21 @@ async def debug_set_breakpoints(
     try:
         session = await manager.get_session(session_id)
 
-        # Build breakpoint list
-        breakpoints = []
-        for i, line in enumerate(lines):
-            condition = None
-            hit_condition = None
-            log_message = None
-            if conditions and i < len(conditions):
-                condition = conditions[i]
-            if hit_conditions and i < len(hit_conditions):
-                hit_condition = hit_conditions[i]
-            if log_messages and i < len(log_messages):
-                log_message = log_messages[i]
-            breakpoints.append(
-                SourceBreakpoint(
-                    line=line,
-                    condition=condition,
-                    hit_condition=hit_condition,
-                    log_message=log_message,
-                )
+        # Build breakpoint list; per-line options may be shorter than lines
+        breakpoints = [
+            SourceBreakpoint(
+                line=line,
+                condition=condition,
+                hit_condition=hit_condition,
+                log_message=log_message,
             )
+            for line, condition, hit_condition, log_message in zip(
+                lines,
+                _padded(conditions),
+                _padded(hit_conditions),
+                _padded(log_messages),
+            )
+        ]
 
         result = await session.set_breakpoints(file_path, breakpoints)
 
@@ -264,11 +311,11 @@ async def debug_set_breakpoints(
                     "line": bp.line,
                     "verified": bp.verified,
                     "message": bp.message,
-                    "condition": breakpoints[i].condition,
-                    "hit_condition": breakpoints[i].hit_condition,
-                    "log_message": breakpoints[i].log_message,
+                    "condition": requested.condition,
+                    "hit_condition": requested.hit_condition,
+                    "log_message": requested.log_message,
                 }
-                for i, bp in enumerate(result)
+                for bp, requested in zip(result, breakpoints)
             ],
         }
     except SessionNotFoundError:
@@ -281,20 +328,7 @@ async def debug_get_breakpoints(session_id: str) -> dict[str, Any]:
     manager = _get_manager()
     try:
         session = await manager.get_session(session_id)
-        return {
-            "files": {
-                path: [
-                    {
-                        "line": bp.line,
-                        "condition": bp.condition,
-                        "hit_condition": bp.hit_condition,
-                        "log_message": bp.log_message,
-                    }
-                    for bp in bps
-                ]
-                for path, bps in session._breakpoints.items()
-            }
-        }
+        return {"files": session.get_breakpoints_summary()}
     except SessionNotFoundError:
         return {"error": f"Session {session_id} not found", "code": "NOT_FOUND"}
 
@@ -489,18 +523,14 @@ async def debug_step(
     try:
         session = await manager.get_session(session_id)
 
-        if mode == "over":
-            await session.step_over(thread_id)
-        elif mode == "into":
-            await session.step_into(thread_id)
-        elif mode == "out":
-            await session.step_out(thread_id)
-        else:
+        method = _STEP_METHODS.get(mode)
+        if method is None:
             return {
                 "error": f"Invalid mode: {mode}. Use 'over', 'into', or 'out'",
                 "code": "INVALID_MODE",
             }
 
+        await getattr(session, method)(thread_id)
         return {"status": "stepping", "mode": mode}
     except SessionNotFoundError:
         return {"error": f"Session {session_id} not found", "code": "NOT_FOUND"}
@@ -549,16 +579,7 @@ async def debug_get_stacktrace(
     try:
         session = await manager.get_session(session_id)
         frames = await session.get_stack_trace(thread_id, levels=max_frames)
-        frame_dicts = [
-            {
-                "id": f.id,
-                "name": f.name,
-                "file": f.source.path if f.source else None,
-                "line": f.line,
-                "column": f.column,
-            }
-            for f in frames
-        ]
+        frame_dicts = _frames_to_dicts(frames)
 
         result: dict[str, Any] = {
             "frames": frame_dicts,
@@ -593,14 +614,7 @@ async def debug_get_scopes(
     try:
         session = await manager.get_session(session_id)
         scopes = await session.get_scopes(frame_id)
-        scope_dicts = [
-            {
-                "name": s.name,
-                "variables_reference": s.variables_reference,
-                "expensive": s.expensive,
-            }
-            for s in scopes
-        ]
+        scope_dicts = _scopes_to_dicts(scopes)
 
         result: dict[str, Any] = {
             "scopes": scope_dicts,
@@ -635,16 +649,7 @@ async def debug_get_variables(
     try:
         session = await manager.get_session(session_id)
         variables = await session.get_variables(variables_reference, count=max_count)
-        var_dicts = [
-            {
-                "name": v.name,
-                "value": v.value,
-                "type": v.type,
-                "variables_reference": v.variables_reference,
-                "has_children": v.variables_reference > 0,
-            }
-            for v in variables
-        ]
+        var_dicts = _variables_to_dicts(variables)
 
         result: dict[str, Any] = {
             "variables": var_dicts,
@@ -660,6 +665,77 @@ async def debug_get_variables(
         return {"error": f"Session {session_id} not found", "code": "NOT_FOUND"}
 
 
+@mcp.tool()
+async def debug_get_frame_state(
+    session_id: str,
+    thread_id: int | None = None,
+    max_frames: int = 20,
+    expand_frames: int = 1,
+    max_variables: int = 100,
+    format: str = "tui",
+) -> dict[str, Any]:
+    """Get the call stack with scopes and variables for the top frames in one call.
+
+    Args:
+        session_id: Session ID
+        thread_id: Thread ID (default: current)
+        max_frames: Max frames (default 20)
+        expand_frames: Number of top frames to include scopes and variables for (default 1)
+        max_variables: Max variables per scope (default 100)
+        format: "json" or "tui"
+    """
+    manager = _get_manager()
+    try:
+        session = await manager.get_session(session_id)
+        frames = await session.get_stack_trace(thread_id, levels=max_frames)
+        frame_dicts = _frames_to_dicts(frames)
+
+        # Scopes for every expanded frame, then variables for every
+        # inexpensive scope, each as one batch of concurrent DAP requests
+        expanded = frame_dicts[: max(expand_frames, 0)]
+        frame_scopes = await asyncio.gather(*(session.get_scopes(f["id"]) for f in expanded))
+        loaded = [s for scopes in frame_scopes for s in scopes if not s.expensive]
+        scope_variables = await asyncio.gather(
+            *(session.get_variables(s.variables_reference, count=max_variables) for s in loaded)
+        )
+        variables_by_ref = {
+            s.variables_reference: _variables_to_dicts(variables)
+            for s, variables in zip(loaded, scope_variables)
+        }
+
+        for frame_dict, scopes in zip(expanded, frame_scopes):
+            scope_dicts = _scopes_to_dicts(scopes)
+            for scope_dict in scope_dicts:
+                if not scope_dict["expensive"]:
+                    scope_dict["variables"] = variables_by_ref[scope_dict["variables_reference"]]
+            frame_dict["scopes"] = scope_dicts
+
+        result: dict[str, Any] = {
+            "frames": frame_dicts,
+            "total": len(frames),
+            "format": format,
+        }
+
+        if format == "tui":
+            formatter = _get_formatter()
+            sections = [formatter.format_stack_trace(frame_dicts)]
+            for frame_dict in expanded:
+                for scope_dict in frame_dict["scopes"]:
+                    if "variables" in scope_dict:
+                        sections.append(
+                            formatter.format_variables(
+                                scope_dict["variables"],
+                                title=f"{scope_dict['name'].upper()} ({frame_dict['name']})",
+                            )
+                        )
+            result["formatted"] = "\n\n".join(sections)
+            result["call_chain"] = formatter.format_call_chain(frame_dicts)
+
+        return result
+    except SessionNotFoundError:
+        return {"error": f"Session {session_id} not found", "code": "NOT_FOUND"}
+
+
 @mcp.tool()
 async def debug_evaluate(
     session_id: str,
@@ -898,17 +974,21 @@ async def debug_evaluate_watches(
 async def debug_poll_events(
     session_id: str,
     timeout_seconds: float = 5.0,
+    coalesce: bool = True,
 ) -> dict[str, Any]:
     """Poll for events (stopped, continued, terminated). Use after launch/step.
 
     Args:
         session_id: Session ID
         timeout_seconds: Wait time (default 5s)
+        coalesce: Merge consecutive output events of one category, with a count
     """
     manager = _get_manager()
     try:
         session = await manager.get_session(session_id)
-        events = await session.event_queue.get_all(timeout=timeout_seconds)
+        events = await session.event_queue.get_all(
+            timeout=timeout_seconds, coalesce_output=coalesce
+        )
         return {
             "events": [
                 {
@@ -1390,8 +1470,6 @@ async def debug_container_launch(
         )
 
         # Give debugpy time to start - container processes may take longer
-        import asyncio
-
         await asyncio.sleep(2.0)
 
         # Get debugpy endpoint
@@ -1,8 +1,9 @@
 """Ring buffer for output capture with size limits."""
 
-from collections import deque
+from collections import Counter, deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from itertools import islice
 
 
 @dataclass
@@ -42,6 +43,10 @@ class OutputBuffer:
         """
         self.max_size = max_size
         self._entries: deque[OutputLine] = deque()
+        # Encoded size of each entry in _entries, in the same order
+        self._sizes: deque[int] = deque()
+        # Entries currently held per category
+        self._category_counts: Counter[str] = Counter()
         self._current_size: int = 0
         self._total_dropped: int = 0
         self._line_counter: int = 0
@@ -58,7 +63,8 @@ class OutputBuffer:
         # Drop oldest entries if needed to make room
         while self._current_size + entry_size > self.max_size and self._entries:
             dropped = self._entries.popleft()
-            self._current_size -= len(dropped.content.encode("utf-8"))
+            self._current_size -= self._sizes.popleft()
+            self._category_counts[dropped.category] -= 1
             self._total_dropped += 1
 
         self._line_counter += 1
@@ -69,6 +75,8 @@ class OutputBuffer:
         )
 
         self._entries.append(entry)
+        self._sizes.append(entry_size)
+        self._category_counts[category] += 1
         self._current_size += entry_size
 
     def get_page(
@@ -87,14 +95,17 @@ class OutputBuffer:
         Returns:
             OutputPage with the requested entries
         """
-        # Filter by category if specified
+        offset = max(offset, 0)
+        limit = max(limit, 0)
+
+        # Filter by category if specified; only the page itself is copied
         if category:
-            entries = [e for e in self._entries if e.category == category]
+            total = self._category_counts[category]
+            entries = (e for e in self._entries if e.category == category)
+            page_entries = list(islice(entries, offset, offset + limit))
         else:
-            entries = list(self._entries)
-
-        total = len(entries)
-        page_entries = entries[offset : offset + limit]
+            total = len(self._entries)
+            page_entries = list(islice(self._entries, offset, offset + limit))
 
         return OutputPage(
             lines=page_entries,
@@ -115,21 +126,29 @@ class OutputBuffer:
         Returns:
             OutputPage with entries after line_number
         """
-        entries = [e for e in self._entries if e.line_number > line_number]
-        page_entries = entries[:limit]
+        limit = max(limit, 0)
+
+        # Line numbers are consecutive, so the start index follows directly
+        start = 0
+        if self._entries:
+            start = min(max(line_number - self._entries[0].line_number + 1, 0), len(self._entries))
+        total = len(self._entries) - start
+        page_entries = list(islice(self._entries, start, start + limit))
 
         return OutputPage(
             lines=page_entries,
             offset=0,
             limit=limit,
-            total=len(entries),
-            has_more=len(entries) > limit,
+            total=total,
+            has_more=total > limit,
             truncated=self._total_dropped > 0,
         )
 
     def clear(self) -> None:
         """Clear all output."""
         self._entries.clear()
+        self._sizes.clear()
+        self._category_counts.clear()
         self._current_size = 0
         self._total_dropped = 0
         self._line_counter = 0
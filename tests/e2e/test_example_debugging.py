@@ -281,7 +281,7 @@ class TestDataProcessorDebugging:
             json={
                 "source": str(processor_script),
                 "breakpoints": [
-                    {"line": 55, "condition": "old_value > 25"}
+                    {"line": 49, "condition": "old_value > 25"}
                 ],  # new_value = transformer(old_value)
             },
         )
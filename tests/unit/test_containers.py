@@ -1,9 +1,13 @@
 """Tests for container debugging support."""
 
+import asyncio
+import json
+
 import pytest
 
 from polybugger_mcp.containers.base import (
     ContainerNotFoundError,
+    ContainerNotRunningError,
     ContainerSecurityError,
 )
 from polybugger_mcp.containers.factory import (
@@ -120,6 +124,38 @@ class TestContainerRuntimeFactory:
         assert runtime.runtime_type == ContainerRuntime.KUBERNETES
         assert runtime.cli_command == "kubectl"
 
+    def test_create_runtime_returns_fresh_instances(self):
+        """Test that cached class lookup does not share adapter instances."""
+        assert create_runtime("kubernetes") is not create_runtime("kubernetes")
+
+    def test_register_runtime_invalidates_lookup(self):
+        """Test that registering a runtime replaces a previously resolved class."""
+        from polybugger_mcp.containers.docker import DockerRuntime
+        from polybugger_mcp.containers.factory import register_runtime
+
+        assert type(create_runtime("docker")) is DockerRuntime
+
+        @register_runtime(ContainerRuntime.DOCKER)
+        class CustomDockerRuntime(DockerRuntime):
+            pass
+
+        try:
+            assert type(create_runtime("docker")) is CustomDockerRuntime
+        finally:
+            register_runtime(ContainerRuntime.DOCKER)(DockerRuntime)
+
+    def test_is_runtime_supported_tracks_registry(self):
+        """Test that support checks see runtimes registered after first use."""
+        from polybugger_mcp.containers import factory
+
+        k8s_class = factory._RUNTIME_REGISTRY.pop(ContainerRuntime.KUBERNETES)
+        factory._supported_runtime_names.cache_clear()
+        try:
+            assert not is_runtime_supported("kubernetes")
+        finally:
+            factory.register_runtime(ContainerRuntime.KUBERNETES)(k8s_class)
+        assert is_runtime_supported("KUBERNETES")
+
     def test_create_invalid_runtime(self):
         """Test error on invalid runtime."""
         from polybugger_mcp.containers.factory import UnsupportedRuntimeError
@@ -180,6 +216,32 @@ class TestContainerDataModels:
         # Invalid line
         assert ProcessInfo.from_ps_line("invalid") is None
 
+    def test_process_info_from_proc_line(self):
+        """Test ProcessInfo.from_proc_line parsing."""
+        proc = ProcessInfo.from_proc_line("7\tpython3\tpython3 -m http.server ")
+        assert proc is not None
+        assert proc.pid == 7
+        assert proc.name == "python3"
+        assert proc.cmdline == "python3 -m http.server"
+        assert proc.is_python
+
+        # Kernel threads have an empty cmdline
+        proc = ProcessInfo.from_proc_line("2\tkthreadd\t")
+        assert proc is not None
+        assert proc.cmdline == "kthreadd"
+        assert not proc.is_python
+
+        # Shebang/console-script launches: comm is the script name
+        proc = ProcessInfo.from_proc_line(
+            "12\tgunicorn\t/usr/local/bin/python3 /usr/local/bin/gunicorn app:app"
+        )
+        assert proc is not None
+        assert proc.name == "gunicorn"
+        assert proc.is_python
+
+        assert ProcessInfo.from_proc_line("invalid") is None
+        assert ProcessInfo.from_proc_line("x\tpython\tpython") is None
+
 
 class TestContainerExceptions:
     """Tests for container exceptions."""
@@ -200,3 +262,886 @@ class TestContainerExceptions:
         )
         assert error.code == "CONTAINER_SECURITY_ERROR"
         assert len(error.instructions) == 2
+
+
+def _counting_runtime(monkeypatch, runtime_name="docker"):
+    """Create a runtime whose container lookups report a running container."""
+    runtime = create_runtime(runtime_name)
+    calls = []
+
+    async def fake_get_container_info(target):
+        calls.append(target.identifier)
+        return ContainerInfo(
+            id="abc123",
+            name=target.identifier,
+            state=ContainerState.RUNNING,
+            image="python:3.11",
+            ports={5678: 45678},
+        )
+
+    monkeypatch.setattr(runtime, "get_container_info", fake_get_container_info)
+    return runtime, calls
+
+
+class TestContainerInfoCache:
+    """Tests for the adapter-level container info cache."""
+
+    async def test_endpoint_lookups_reuse_container_info(self, monkeypatch):
+        """Test that back-to-back endpoint queries inspect the container once."""
+        runtime, calls = _counting_runtime(monkeypatch)
+        target = ContainerTarget(runtime=ContainerRuntime.DOCKER, container_name="app")
+
+        assert await runtime.get_debugpy_endpoint(target) == ("127.0.0.1", 45678)
+        assert await runtime.get_debugpy_endpoint(target) == ("127.0.0.1", 45678)
+        assert calls == ["app"]
+
+    async def test_invalidate_forces_fresh_lookup(self, monkeypatch):
+        """Test that invalidation drops the cached entry for a target."""
+        runtime, calls = _counting_runtime(monkeypatch)
+        target = ContainerTarget(runtime=ContainerRuntime.DOCKER, container_name="app")
+
+        await runtime.get_cached_container_info(target)
+        runtime.invalidate_container_info(target)
+        await runtime.get_cached_container_info(target)
+        assert calls == ["app", "app"]
+
+    async def test_expired_entry_is_refreshed(self, monkeypatch):
+        """Test that entries older than the TTL are re-inspected."""
+        runtime, calls = _counting_runtime(monkeypatch)
+        runtime.info_cache_ttl = 0.0
+        target = ContainerTarget(runtime=ContainerRuntime.DOCKER, container_name="app")
+
+        await runtime.get_cached_container_info(target)
+        await runtime.get_cached_container_info(target)
+        assert calls == ["app", "app"]
+
+    async def test_docker_exec_reuses_running_check(self, monkeypatch):
+        """Test that consecutive execs share one container inspect."""
+        runtime, calls = _counting_runtime(monkeypatch)
+        target = ContainerTarget(runtime=ContainerRuntime.DOCKER, container_name="app")
+
+        async def fake_run_cli(*args, timeout=30.0, check=False):
+            return ExecResult(exit_code=0, stdout="", stderr="")
+
+        monkeypatch.setattr(runtime, "_run_cli", fake_run_cli)
+
+        await runtime.exec_command(target, ["true"])
+        await runtime.exec_command(target, ["true"])
+        assert calls == ["app"]
+
+    async def test_docker_exec_on_stopped_container_invalidates(self, monkeypatch):
+        """Test that an exec reporting a stopped container drops the cached info."""
+        runtime, calls = _counting_runtime(monkeypatch)
+        target = ContainerTarget(runtime=ContainerRuntime.DOCKER, container_name="app")
+
+        async def fake_run_cli(*args, timeout=30.0, check=False):
+            return ExecResult(exit_code=1, stdout="", stderr="container app is not running")
+
+        monkeypatch.setattr(runtime, "_run_cli", fake_run_cli)
+
+        await runtime.exec_command(target, ["true"])
+        await runtime.exec_command(target, ["true"])
+        assert calls == ["app", "app"]
+
+    async def test_docker_exec_without_verify_skips_inspect(self, monkeypatch):
+        """Test that verify_running=False trusts the caller and maps stopped errors."""
+        runtime, calls = _counting_runtime(monkeypatch)
+        target = ContainerTarget(runtime=ContainerRuntime.DOCKER, container_name="app")
+        results = [
+            ExecResult(exit_code=0, stdout="", stderr=""),
+            ExecResult(exit_code=1, stdout="", stderr="container app is not running"),
+        ]
+
+        async def fake_run_cli(*args, timeout=30.0, check=False):
+            return results.pop(0)
+
+        monkeypatch.setattr(runtime, "_run_cli", fake_run_cli)
+
+        assert (await runtime.exec_command(target, ["true"], verify_running=False)).success
+        with pytest.raises(ContainerNotRunningError):
+            await runtime.exec_command(target, ["true"], verify_running=False)
+        assert calls == []
+
+    async def test_docker_batch_inspect_uses_single_call(self, monkeypatch):
+        """Test that several targets are inspected with one CLI invocation."""
+        runtime = create_runtime("docker")
+        cli_calls = []
+
+        async def fake_run_cli(*args, timeout=30.0, check=False):
+            cli_calls.append(args)
+            stdout = "\n".join(
+                json.dumps(
+                    {
+                        "Id": f"{name}0123456789abcdef",
+                        "Name": f"/{name}",
+                        "State": {"Status": "running"},
+                    }
+                )
+                for name in ("web", "worker")
+            )
+            return ExecResult(exit_code=0, stdout=stdout, stderr="")
+
+        monkeypatch.setattr(runtime, "_run_cli", fake_run_cli)
+        targets = [
+            ContainerTarget(runtime=ContainerRuntime.DOCKER, container_name="worker"),
+            ContainerTarget(runtime=ContainerRuntime.DOCKER, container_id="web0123456"),
+        ]
+
+        infos = await runtime.get_container_infos(targets)
+
+        assert [info.name for info in infos] == ["worker", "web"]
+        assert len(cli_calls) == 1
+        assert await runtime.get_cached_container_info(targets[1]) is infos[1]
+        assert len(cli_calls) == 1
+
+    async def test_kubernetes_exec_reuses_running_check(self, monkeypatch):
+        """Test that consecutive pod execs share one pod lookup."""
+        runtime, calls = _counting_runtime(monkeypatch, "kubernetes")
+        target = ContainerTarget(runtime=ContainerRuntime.KUBERNETES, pod_name="api")
+
+        async def fake_run_kubectl(*args, timeout=30.0, check=False):
+            return ExecResult(exit_code=0, stdout="", stderr="")
+
+        monkeypatch.setattr(runtime, "_run_kubectl", fake_run_kubectl)
+
+        await runtime.exec_command(target, ["true"])
+        await runtime.exec_command(target, ["true"])
+        assert calls == ["default/api"]
+
+    async def test_kubernetes_exec_on_completed_pod_invalidates(self, monkeypatch):
+        """Test that an exec into a completed pod drops the cached info."""
+        runtime, calls = _counting_runtime(monkeypatch, "kubernetes")
+        target = ContainerTarget(runtime=ContainerRuntime.KUBERNETES, pod_name="api")
+
+        async def fake_run_kubectl(*args, timeout=30.0, check=False):
+            return ExecResult(
+                exit_code=1,
+                stdout="",
+                stderr="error: cannot exec into a container in a completed pod",
+            )
+
+        monkeypatch.setattr(runtime, "_run_kubectl", fake_run_kubectl)
+
+        await runtime.exec_command(target, ["true"])
+        with pytest.raises(ContainerNotRunningError):
+            await runtime.exec_command(target, ["true"], verify_running=False)
+        await runtime.exec_command(target, ["true"])
+        assert calls == ["default/api", "default/api"]
+
+    async def test_kubernetes_batch_lookup_one_call_per_namespace(self, monkeypatch):
+        """Test that pods in the same namespace are fetched together."""
+        runtime = create_runtime("kubernetes")
+        kubectl_calls = []
+
+        def pod(name):
+            return {
+                "kind": "Pod",
+                "metadata": {"name": name, "uid": f"{name}-uid"},
+                "status": {"phase": "Running", "podIP": "10.0.0.1"},
+                "spec": {"containers": [{"image": "python:3.12"}]},
+            }
+
+        async def fake_run_kubectl(*args, timeout=30.0, check=False):
+            kubectl_calls.append(args)
+            names = args[2 : args.index("-n")]
+            if len(names) == 1:
+                return ExecResult(exit_code=0, stdout=json.dumps(pod(names[0])), stderr="")
+            items = [pod(name) for name in names]
+            return ExecResult(
+                exit_code=0, stdout=json.dumps({"kind": "List", "items": items}), stderr=""
+            )
+
+        monkeypatch.setattr(runtime, "_run_kubectl", fake_run_kubectl)
+        targets = [
+            ContainerTarget(runtime=ContainerRuntime.KUBERNETES, pod_name="api", namespace="web"),
+            ContainerTarget(
+                runtime=ContainerRuntime.KUBERNETES, pod_name="worker", namespace="web"
+            ),
+            ContainerTarget(runtime=ContainerRuntime.KUBERNETES, pod_name="db"),
+        ]
+
+        infos = await runtime.get_container_infos(targets)
+
+        assert [info.name for info in infos] == ["api", "worker", "db"]
+        assert all(info.is_running for info in infos)
+        assert len(kubectl_calls) == 2
+
+
+class TestDockerRuntime:
+    """Tests for DockerRuntime command handling and parsing."""
+
+    async def test_batch_inspect_prefers_exact_name(self, monkeypatch):
+        """Test that a hex-like name isn't matched to another container's ID prefix."""
+        runtime = create_runtime("docker")
+
+        async def fake_run_cli(*args, timeout=30.0, check=False):
+            stdout = "\n".join(
+                json.dumps({"Id": cid, "Name": f"/{name}", "State": {"Status": "running"}})
+                for cid, name in (("cafe0123456789ab", "api"), ("beef0123456789ab", "cafe"))
+            )
+            return ExecResult(exit_code=0, stdout=stdout, stderr="")
+
+        monkeypatch.setattr(runtime, "_run_cli", fake_run_cli)
+        targets = [
+            ContainerTarget(runtime=ContainerRuntime.DOCKER, container_name="cafe"),
+            ContainerTarget(runtime=ContainerRuntime.DOCKER, container_id="cafe0123"),
+        ]
+
+        infos = await runtime.get_container_infos(targets)
+
+        assert [info.name for info in infos] == ["cafe", "api"]
+
+    async def test_batch_inspect_missing_container(self, monkeypatch):
+        """Test that a target absent from the batch output raises not found."""
+        runtime = create_runtime("docker")
+
+        async def fake_run_cli(*args, timeout=30.0, check=False):
+            return ExecResult(exit_code=1, stdout="", stderr="Error: No such object: ghost")
+
+        monkeypatch.setattr(runtime, "_run_cli", fake_run_cli)
+        target = ContainerTarget(runtime=ContainerRuntime.DOCKER, container_name="ghost")
+
+        with pytest.raises(ContainerNotFoundError):
+            await runtime.get_container_infos([target])
+
+    async def test_install_debugpy_single_exec(self, monkeypatch):
+        """Test that the pip fallbacks run inside one exec."""
+        runtime, _ = _counting_runtime(monkeypatch)
+        target = ContainerTarget(runtime=ContainerRuntime.DOCKER, container_name="app")
+        cli_calls = []
+
+        async def fake_run_cli(*args, timeout=30.0, check=False):
+            cli_calls.append(args)
+            return ExecResult(exit_code=0, stdout="", stderr="")
+
+        monkeypatch.setattr(runtime, "_run_cli", fake_run_cli)
+
+        await runtime.install_debugpy(target)
+
+        assert len(cli_calls) == 1
+        script = cli_calls[0][-1]
+        assert script.index("pip install") < script.index("pip3 install")
+        assert "python -m pip install" in script
+
+    async def test_find_processes_falls_back_to_proc_scan(self, monkeypatch):
+        """Test that containers without ps are listed from /proc."""
+        runtime, calls = _counting_runtime(monkeypatch)
+        target = ContainerTarget(runtime=ContainerRuntime.DOCKER, container_name="app")
+        results = [
+            ExecResult(exit_code=127, stdout="", stderr="ps: not found"),
+            ExecResult(
+                exit_code=0,
+                stdout="1\tsh\tsh -c run\n12\tpython\tpython app.py\n",
+                stderr="",
+            ),
+        ]
+
+        async def fake_run_cli(*args, timeout=30.0, check=False):
+            return results.pop(0)
+
+        monkeypatch.setattr(runtime, "_run_cli", fake_run_cli)
+
+        processes = await runtime.find_python_processes(target)
+
+        assert [p.pid for p in processes] == [12]
+        assert calls == ["app"]
+
+    async def test_absolute_cli_path_skips_path_search(self, monkeypatch):
+        """Test that an absolute CLI override is checked directly."""
+        runtime = create_runtime("docker", cli_override="/nonexistent/docker")
+
+        def fail_which(cmd):
+            raise AssertionError("PATH should not be searched")
+
+        monkeypatch.setattr("polybugger_mcp.containers.docker.shutil.which", fail_which)
+        assert not await runtime.is_available()
+
+    def test_parse_inspect(self):
+        """Test ContainerInfo extraction from docker inspect JSON."""
+        runtime = create_runtime("docker")
+        info = runtime._parse_inspect(
+            {
+                "Id": "0123456789abcdef",
+                "Name": "/web",
+                "State": {"Status": "running"},
+                "Config": {"Image": "python:3.12", "Labels": {"app": "web"}},
+                "NetworkSettings": {
+                    "Networks": {"none": {"IPAddress": ""}, "bridge": {"IPAddress": "172.17.0.2"}},
+                    "Ports": {
+                        "5678/tcp": [{"HostIp": "0.0.0.0", "HostPort": "45678"}],
+                        "8000/tcp": None,
+                    },
+                },
+            }
+        )
+
+        assert info.id == "0123456789ab"
+        assert info.name == "web"
+        assert info.state == ContainerState.RUNNING
+        assert info.ip_address == "172.17.0.2"
+        assert info.ports == {5678: 45678}
+        assert info.labels == {"app": "web"}
+
+    async def test_find_processes_from_ps(self, monkeypatch):
+        """Test that only Python processes are returned from ps output."""
+        runtime, _ = _counting_runtime(monkeypatch)
+        target = ContainerTarget(runtime=ContainerRuntime.DOCKER, container_name="app")
+        stdout = (
+            "USER PID %CPU %MEM VSZ RSS TTY STAT START TIME COMMAND\n"
+            "root 1 0.0 0.1 1000 500 ? Ss 00:00 0:00 nginx: master process\n"
+            "app 9 1.5 2.0 9000 800 ? Sl 00:00 0:01 /usr/bin/python3 -m app\n"
+        )
+
+        async def fake_run_cli(*args, timeout=30.0, check=False):
+            return ExecResult(exit_code=0, stdout=stdout, stderr="")
+
+        monkeypatch.setattr(runtime, "_run_cli", fake_run_cli)
+
+        processes = await runtime.find_python_processes(target)
+
+        assert [(p.pid, p.user, p.name) for p in processes] == [(9, "app", "python3")]
+
+
+class TestKubernetesRuntime:
+    """Tests for Kubernetes pod operations."""
+
+    @staticmethod
+    def _scripted_runtime(monkeypatch, result):
+        runtime = create_runtime("kubernetes")
+        scripts = []
+
+        async def fake_exec_shell(target, script, timeout=30.0, verify_running=True):
+            scripts.append(script)
+            return result
+
+        monkeypatch.setattr(runtime, "_exec_shell", fake_exec_shell)
+        return runtime, scripts
+
+    async def test_inject_runs_single_exec(self, monkeypatch):
+        """Test that check, install and inject share one kubectl exec."""
+        runtime, scripts = self._scripted_runtime(
+            monkeypatch, ExecResult(exit_code=0, stdout="", stderr="")
+        )
+        target = ContainerTarget(runtime=ContainerRuntime.KUBERNETES, pod_name="api")
+
+        await runtime.inject_debugpy(target, process_id=42, port=5679)
+
+        assert len(scripts) == 1
+        assert "import debugpy" in scripts[0]
+        assert scripts[0].endswith("--listen 0.0.0.0:5679 --pid 42")
+
+    async def test_inject_reports_install_failure(self, monkeypatch):
+        """Test that a failed install is reported as the pip step."""
+        from polybugger_mcp.containers.base import ContainerExecError
+
+        runtime, _ = self._scripted_runtime(
+            monkeypatch, ExecResult(exit_code=97, stdout="", stderr="pip: not found")
+        )
+        target = ContainerTarget(runtime=ContainerRuntime.KUBERNETES, pod_name="api")
+
+        with pytest.raises(ContainerExecError) as exc_info:
+            await runtime.inject_debugpy(target, process_id=42)
+        assert exc_info.value.details["command"] == "pip install debugpy"
+
+    async def test_inject_reports_ptrace_denied(self, monkeypatch):
+        """Test that ptrace failures surface as security errors."""
+        runtime, _ = self._scripted_runtime(
+            monkeypatch,
+            ExecResult(exit_code=1, stdout="", stderr="ptrace: Operation not permitted"),
+        )
+        target = ContainerTarget(runtime=ContainerRuntime.KUBERNETES, pod_name="api")
+
+        with pytest.raises(ContainerSecurityError):
+            await runtime.inject_debugpy(target, process_id=42)
+
+    async def test_launch_applies_env_and_workdir_before_nohup(self, monkeypatch):
+        """Test that shell builtins aren't passed to nohup."""
+        runtime, scripts = self._scripted_runtime(
+            monkeypatch, ExecResult(exit_code=0, stdout="", stderr="")
+        )
+        target = ContainerTarget(runtime=ContainerRuntime.KUBERNETES, pod_name="api")
+
+        await runtime.launch_with_debugpy(
+            target, ["app.py"], env={"DEBUG": "1"}, workdir="/srv", wait_for_client=False
+        )
+
+        assert len(scripts) == 1
+        assert "export DEBUG=1; cd /srv && nohup python -m debugpy" in scripts[0]
+
+    async def test_cleanup_port_forwards_closes_concurrently(self):
+        """Test that port-forwards are closed together and the registry cleared."""
+        import asyncio
+
+        from polybugger_mcp.containers.models import PortForward
+
+        runtime = create_runtime("kubernetes")
+        started = asyncio.Event()
+        closing = []
+
+        class SlowPortForward(PortForward):
+            async def close(self):
+                closing.append(self.local_port)
+                if len(closing) == 2:
+                    started.set()
+                await asyncio.wait_for(started.wait(), timeout=1.0)
+
+        runtime._port_forwards = {
+            "ns/a:5678": SlowPortForward(local_port=1, remote_port=5678),
+            "ns/b:5678": SlowPortForward(local_port=2, remote_port=5678),
+        }
+
+        await runtime.cleanup_port_forwards()
+
+        assert sorted(closing) == [1, 2]
+        assert runtime._port_forwards == {}
+
+    @staticmethod
+    def _fake_kubectl(monkeypatch, script):
+        """Run a Python script in place of kubectl port-forward."""
+        import asyncio
+        import sys
+
+        real_exec = asyncio.create_subprocess_exec
+        commands = []
+
+        async def fake_exec(*cmd, **kwargs):
+            commands.append(cmd)
+            return await real_exec(sys.executable, "-c", script, **kwargs)
+
+        monkeypatch.setattr(
+            "polybugger_mcp.containers.kubernetes.asyncio.create_subprocess_exec", fake_exec
+        )
+        return commands
+
+    async def test_port_forward_ready_on_forwarding_line(self, monkeypatch):
+        """Test that readiness and the local port come from kubectl's Forwarding line."""
+        commands = self._fake_kubectl(
+            monkeypatch,
+            "import sys, time\n"
+            "print('Forwarding from 127.0.0.1:45678 -> 5678', flush=True)\n"
+            "time.sleep(30)\n",
+        )
+        runtime = create_runtime("kubernetes")
+        target = ContainerTarget(runtime=ContainerRuntime.KUBERNETES, pod_name="api")
+
+        try:
+            assert await runtime.get_debugpy_endpoint(target) == ("127.0.0.1", 45678)
+            assert commands[0][-3:] == ("--address", "127.0.0.1", ":5678")
+            assert runtime._port_forwards["default/api:5678"].local_port == 45678
+        finally:
+            await runtime.cleanup_port_forwards()
+
+    async def test_port_forward_output_is_drained(self, tmp_path, monkeypatch):
+        """Test that kubectl output after readiness can't fill the pipes."""
+        done = tmp_path / "done"
+        self._fake_kubectl(
+            monkeypatch,
+            "import sys, time\n"
+            "print('Forwarding from 127.0.0.1:45678 -> 5678', flush=True)\n"
+            "for _ in range(20000):\n"
+            "    print('Handling connection for 45678', flush=True)\n"
+            "    sys.stderr.write('E1016 an error occurred forwarding\\n')\n"
+            f"open({str(done)!r}, 'w').close()\n"
+            "time.sleep(30)\n",
+        )
+        runtime = create_runtime("kubernetes")
+        target = ContainerTarget(runtime=ContainerRuntime.KUBERNETES, pod_name="api")
+
+        try:
+            await runtime.get_debugpy_endpoint(target)
+            pf = runtime._port_forwards["default/api:5678"]
+            for _ in range(100):
+                if done.exists():
+                    break
+                await asyncio.sleep(0.05)
+            assert done.exists()
+        finally:
+            await runtime.cleanup_port_forwards()
+
+        await asyncio.sleep(0)
+        assert pf.output_reader.done()
+
+    async def test_port_forward_failure_reports_stderr(self, monkeypatch):
+        """Test that kubectl exiting before binding raises with its stderr."""
+        from polybugger_mcp.containers.base import ContainerError
+
+        self._fake_kubectl(
+            monkeypatch,
+            "import sys\nsys.stderr.write('error: pod not running')\nsys.exit(1)\n",
+        )
+        runtime = create_runtime("kubernetes")
+        target = ContainerTarget(runtime=ContainerRuntime.KUBERNETES, pod_name="api")
+
+        with pytest.raises(ContainerError, match="pod not running"):
+            await runtime.get_debugpy_endpoint(target)
+        assert runtime._port_forwards == {}
+
+    async def test_find_processes_falls_back_to_proc_scan(self, monkeypatch):
+        """Test that pods without ps are listed from /proc."""
+        from polybugger_mcp.containers.models import PROC_SCAN_SCRIPT
+
+        runtime = create_runtime("kubernetes")
+        commands = []
+        results = [
+            ExecResult(exit_code=127, stdout="", stderr="sh: ps: not found"),
+            ExecResult(
+                exit_code=0, stdout="1\tpause\t/pause\n8\tpython3\tpython3 app.py\n", stderr=""
+            ),
+        ]
+
+        async def fake_exec_argv(target, argv, timeout=30.0, verify_running=True):
+            commands.append(argv)
+            return results.pop(0)
+
+        monkeypatch.setattr(runtime, "_exec_argv", fake_exec_argv)
+        target = ContainerTarget(runtime=ContainerRuntime.KUBERNETES, pod_name="api")
+
+        processes = await runtime.find_python_processes(target)
+
+        assert [(p.pid, p.cmdline) for p in processes] == [(8, "python3 app.py")]
+        assert commands == [["ps", "aux"], ["sh", "-c", PROC_SCAN_SCRIPT]]
+
+    def test_parse_pod_states(self):
+        """Test pod phase and container status mapping."""
+        runtime = create_runtime("kubernetes")
+        pod = {
+            "metadata": {"uid": "0123456789abcdef", "labels": {"app": "api"}},
+            "status": {
+                "phase": "Running",
+                "podIP": "10.1.2.3",
+                "containerStatuses": [
+                    {"name": "app", "state": {"running": {"startedAt": "now"}}},
+                    {"name": "sidecar", "state": {"terminated": {"exitCode": 0}}},
+                ],
+            },
+            "spec": {"containers": [{"image": "python:3.12"}]},
+        }
+
+        info = runtime._parse_pod(
+            pod, ContainerTarget(runtime=ContainerRuntime.KUBERNETES, pod_name="api")
+        )
+        assert info.state == ContainerState.RUNNING
+        assert info.ip_address == "10.1.2.3"
+        assert info.id == "0123456789ab"
+
+        sidecar = ContainerTarget(
+            runtime=ContainerRuntime.KUBERNETES, pod_name="api", pod_container="sidecar"
+        )
+        assert runtime._parse_pod(pod, sidecar).state == ContainerState.EXITED
+
+        pod["status"]["phase"] = "Failed"
+        info = runtime._parse_pod(
+            pod, ContainerTarget(runtime=ContainerRuntime.KUBERNETES, pod_name="api")
+        )
+        assert info.state == ContainerState.DEAD
+
+    async def test_find_processes_only_parses_python_lines(self, monkeypatch):
+        """Test that non-Python ps lines are never parsed."""
+        runtime = create_runtime("kubernetes")
+        stdout = (
+            "USER PID %CPU %MEM VSZ RSS TTY STAT START TIME COMMAND\n"
+            "root 1 0.0 0.0 1000 4 ? Ss 00:00 0:00 /pause\n"
+            "app 7 0.3 1.2 9000 800 ? Sl 00:00 0:02 python -m uvicorn main:app\n"
+        )
+        parsed = []
+        real_from_ps_line = ProcessInfo.from_ps_line
+
+        def counting_from_ps_line(line):
+            parsed.append(line)
+            return real_from_ps_line(line)
+
+        async def fake_exec_argv(target, argv, timeout=30.0, verify_running=True):
+            return ExecResult(exit_code=0, stdout=stdout, stderr="")
+
+        monkeypatch.setattr(runtime, "_exec_argv", fake_exec_argv)
+        monkeypatch.setattr(ProcessInfo, "from_ps_line", counting_from_ps_line)
+        target = ContainerTarget(runtime=ContainerRuntime.KUBERNETES, pod_name="api")
+
+        processes = await runtime.find_python_processes(target)
+
+        assert [p.pid for p in processes] == [7]
+        assert len(parsed) == 1
+
+    async def test_exec_command_quotes_arguments(self, monkeypatch):
+        """Test argv passthrough and shell quoting for env/workdir."""
+        runtime = create_runtime("kubernetes")
+        commands = []
+
+        async def fake_exec_argv(target, argv, timeout=30.0, verify_running=True):
+            commands.append(argv)
+            return ExecResult(exit_code=0, stdout="", stderr="")
+
+        monkeypatch.setattr(runtime, "_exec_argv", fake_exec_argv)
+        target = ContainerTarget(runtime=ContainerRuntime.KUBERNETES, pod_name="api")
+
+        await runtime.exec_command(target, ["echo", "a b; rm -rf /"])
+        await runtime.exec_command(
+            target, ["echo", "$HOME"], env={"GREETING": "hi there"}, workdir="/my app"
+        )
+
+        assert commands[0] == ["echo", "a b; rm -rf /"]
+        assert commands[1] == [
+            "sh",
+            "-c",
+            "cd '/my app' && GREETING='hi there' echo '$HOME'",
+        ]
+
+    async def test_kubectl_global_options_prefix_every_call(self, monkeypatch):
+        """Test that context and kubeconfig are passed on each kubectl call."""
+        commands = self._fake_kubectl(monkeypatch, "print('ok')")
+        runtime = create_runtime("kubernetes", context="staging", kubeconfig="/etc/kube.yaml")
+
+        result = await runtime._run_kubectl("get", "pods")
+
+        assert result.stdout.strip() == "ok"
+        assert commands == [
+            ("kubectl", "--context", "staging", "--kubeconfig", "/etc/kube.yaml", "get", "pods")
+        ]
+
+    async def test_batch_lookup_missing_pod(self, monkeypatch):
+        """Test that a pod absent from the batch output raises not found."""
+        runtime = create_runtime("kubernetes")
+
+        async def fake_run_kubectl(*args, timeout=30.0, check=False):
+            return ExecResult(
+                exit_code=1,
+                stdout="",
+                stderr='Error from server (NotFound): pods "ghost" not found',
+            )
+
+        monkeypatch.setattr(runtime, "_run_kubectl", fake_run_kubectl)
+        target = ContainerTarget(runtime=ContainerRuntime.KUBERNETES, pod_name="ghost")
+
+        with pytest.raises(ContainerNotFoundError):
+            await runtime.get_container_infos([target])
+
+
+class TestSSHTunnel:
+    """Tests for SSH tunnel readiness and failure handling."""
+
+    @staticmethod
+    def _fake_ssh(tmp_path, monkeypatch, body):
+        """Install a Python script as the ssh client."""
+        import sys
+
+        from polybugger_mcp.containers.ssh_tunnel import SSHTunnelManager
+
+        script = tmp_path / "ssh"
+        script.write_text(f"#!{sys.executable}\nimport sys, time\n{body}\n")
+        script.chmod(0o755)
+        manager = SSHTunnelManager()
+        monkeypatch.setattr(manager, "_get_ssh_command", lambda: str(script))
+        return manager
+
+    async def test_ready_when_ssh_reports_listener(self, tmp_path, monkeypatch):
+        """Test that readiness comes from ssh's listening message."""
+        manager = self._fake_ssh(
+            tmp_path,
+            monkeypatch,
+            "sys.stderr.write('debug1: Local forwarding listening on 127.0.0.1 port 1.\\n')\n"
+            "sys.stderr.flush()\n"
+            "time.sleep(30)",
+        )
+
+        tunnel = await manager.create_tunnel(SSHConfig(host="bastion", user="dev"))
+        try:
+            assert tunnel.is_active
+            assert manager.active_count == 1
+        finally:
+            assert await manager.close_all() == 1
+        assert not tunnel.is_active
+
+    async def test_failed_start_reports_ssh_errors(self, tmp_path, monkeypatch):
+        """Test that early exits raise with ssh's non-debug stderr."""
+        from polybugger_mcp.containers.ssh_tunnel import SSHTunnelError
+
+        manager = self._fake_ssh(
+            tmp_path,
+            monkeypatch,
+            "sys.stderr.write('debug1: Connecting to bastion\\n')\n"
+            "sys.stderr.write('ssh: connect to host bastion port 22: Connection refused\\n')\n"
+            "sys.exit(255)",
+        )
+
+        with pytest.raises(SSHTunnelError) as exc_info:
+            await manager.create_tunnel(SSHConfig(host="bastion", user="dev"))
+
+        assert exc_info.value.details["exit_code"] == 255
+        assert exc_info.value.details["stderr"] == (
+            "ssh: connect to host bastion port 22: Connection refused"
+        )
+        assert manager.active_count == 0
+
+    def test_ssh_command_lookup_is_cached(self, monkeypatch):
+        """Test that the ssh client is only looked up on PATH once."""
+        from polybugger_mcp.containers import ssh_tunnel
+
+        calls: list[str] = []
+
+        def fake_which(name):
+            calls.append(name)
+            return "/usr/bin/ssh"
+
+        monkeypatch.setattr(ssh_tunnel.shutil, "which", fake_which)
+        manager = ssh_tunnel.SSHTunnelManager()
+
+        assert manager._get_ssh_command() == "/usr/bin/ssh"
+        assert manager._get_ssh_command() == "/usr/bin/ssh"
+        assert calls == ["ssh"]
+
+        manager.refresh_ssh_path()
+        manager._get_ssh_command()
+        assert calls == ["ssh", "ssh"]
+
+    async def test_existing_tunnel_reused_without_spawning(self, tmp_path, monkeypatch):
+        """Test that an active tunnel is returned without starting ssh again."""
+        manager = self._fake_ssh(
+            tmp_path,
+            monkeypatch,
+            "sys.stderr.write('debug1: Local forwarding listening on 127.0.0.1 port 1.\\n')\n"
+            "sys.stderr.flush()\n"
+            "time.sleep(30)",
+        )
+        config = SSHConfig(host="bastion", user="dev")
+
+        try:
+            first = await manager.create_tunnel(config)
+            monkeypatch.setattr(manager, "_get_ssh_command", lambda: None)
+            assert await manager.create_tunnel(config) is first
+            assert await manager.get_tunnel("bastion", "127.0.0.1", 5678) is first
+        finally:
+            await manager.close_all()
+
+    async def test_close_all_closes_tunnels_concurrently(self):
+        """Test that close_all doesn't wait for each tunnel in turn."""
+        from polybugger_mcp.containers.ssh_tunnel import SSHTunnel, SSHTunnelManager
+
+        closing = 0
+        peak = 0
+
+        async def slow_close() -> None:
+            nonlocal closing, peak
+            closing += 1
+            peak = max(peak, closing)
+            await asyncio.sleep(0.05)
+            closing -= 1
+
+        manager = SSHTunnelManager()
+        for port in (5678, 5679, 5680):
+            tunnel = SSHTunnel(
+                local_port=port,
+                remote_host="127.0.0.1",
+                remote_port=port,
+                ssh_host="bastion",
+                ssh_user="dev",
+            )
+            tunnel.close = slow_close  # type: ignore[method-assign]
+            manager._tunnels[f"bastion:127.0.0.1:{port}"] = tunnel
+
+        assert await manager.close_all() == 3
+        assert peak == 3
+        assert manager._tunnels == {}
+
+    async def test_chatty_ssh_does_not_stall(self, tmp_path, monkeypatch):
+        """Test that ssh output beyond a pipe buffer doesn't block the tunnel."""
+        manager = self._fake_ssh(
+            tmp_path,
+            monkeypatch,
+            "sys.stderr.write('debug1: Local forwarding listening on 127.0.0.1 port 1.\\n')\n"
+            "for _ in range(5000):\n"
+            "    sys.stderr.write('debug3: ' + 'x' * 100 + '\\n')\n"
+            "    sys.stdout.write('y' * 100)\n"
+            "sys.stderr.flush()\n"
+            "sys.stdout.flush()\n"
+            "sys.stderr.write('finished\\n')\n"
+            "sys.stderr.flush()\n"
+            "time.sleep(30)",
+        )
+
+        tunnel = await manager.create_tunnel(SSHConfig(host="bastion", user="dev"))
+        try:
+            for _ in range(100):
+                if tunnel.error_output.endswith("finished"):
+                    break
+                await asyncio.sleep(0.05)
+            assert tunnel.error_output.endswith("finished")
+            assert len(tunnel._stderr_lines) == 200
+        finally:
+            await manager.close_all()
+
+    async def test_wait_ready_probe_without_ssh_output(self):
+        """Test the connect probe used when ssh output isn't available."""
+        from polybugger_mcp.containers.ssh_tunnel import SSHTunnel, _get_free_port
+
+        server = await asyncio.start_server(lambda _reader, writer: writer.close(), "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            tunnel = SSHTunnel(
+                local_port=port,
+                remote_host="127.0.0.1",
+                remote_port=5678,
+                ssh_host="bastion",
+                ssh_user="dev",
+            )
+            assert await tunnel.wait_ready(timeout=1.0)
+        finally:
+            server.close()
+            await server.wait_closed()
+
+        closed = SSHTunnel(
+            local_port=_get_free_port(),
+            remote_host="127.0.0.1",
+            remote_port=5678,
+            ssh_host="bastion",
+            ssh_user="dev",
+        )
+        assert not await closed.wait_ready(timeout=1.0)
+
+    async def test_ssh_environment(self, tmp_path, monkeypatch):
+        """Test askpass is disabled without a key and the env is otherwise inherited."""
+        from polybugger_mcp.containers.ssh_tunnel import SSHTunnelError
+
+        monkeypatch.setenv("POLYBUGGER_TEST_MARKER", "inherited")
+        manager = self._fake_ssh(
+            tmp_path,
+            monkeypatch,
+            "import os\n"
+            "sys.stderr.write(repr((os.environ.get('SSH_ASKPASS_REQUIRE'),"
+            " os.environ.get('POLYBUGGER_TEST_MARKER'))) + '\\n')\n"
+            "sys.exit(1)",
+        )
+        key_file = tmp_path / "id_test"
+        key_file.write_text("")
+
+        with pytest.raises(SSHTunnelError) as no_key:
+            await manager.create_tunnel(SSHConfig(host="bastion", user="dev"))
+        with pytest.raises(SSHTunnelError) as with_key:
+            await manager.create_tunnel(
+                SSHConfig(host="bastion", user="dev", key_path=str(key_file))
+            )
+
+        assert no_key.value.details["stderr"] == "('never', 'inherited')"
+        assert with_key.value.details["stderr"] == "(None, 'inherited')"
+        assert manager._get_no_askpass_env() is manager._get_no_askpass_env()
+
+    async def test_concurrent_creates_share_one_ssh(self, tmp_path, monkeypatch):
+        """Test concurrent requests for one target start a single ssh process."""
+        starts = tmp_path / "starts"
+        manager = self._fake_ssh(
+            tmp_path,
+            monkeypatch,
+            f"open({str(starts)!r}, 'a').write('started\\n')\n"
+            "time.sleep(0.2)\n"
+            "sys.stderr.write('debug1: Local forwarding listening on 127.0.0.1 port 1.\\n')\n"
+            "sys.stderr.flush()\n"
+            "time.sleep(30)",
+        )
+        config = SSHConfig(host="bastion", user="dev")
+
+        try:
+            tunnels = await asyncio.gather(*(manager.create_tunnel(config) for _ in range(3)))
+            assert tunnels[0] is tunnels[1] is tunnels[2]
+            assert starts.read_text().splitlines() == ["started"]
+            assert manager._pending == {}
+        finally:
+            await manager.close_all()
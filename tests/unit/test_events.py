@@ -119,6 +119,35 @@ class TestEventQueue:
         assert len(history) == 1
         assert history[0].type == EventType.STOPPED
 
+    @pytest.mark.asyncio
+    async def test_history_is_bounded(self):
+        """Test history keeps only the most recent events."""
+        queue = EventQueue(max_history=3)
+        for i in range(5):
+            await queue.put(EventType.OUTPUT, {"n": i})
+
+        history = queue.history
+        assert isinstance(history, list)
+        assert [e.data["n"] for e in history] == [2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_get_all_returns_when_first_event_arrives(self, event_queue):
+        """Test long-polling returns on the first event, not at the timeout."""
+
+        async def publish() -> None:
+            await asyncio.sleep(0.05)
+            await event_queue.put(EventType.STOPPED, {})
+            await event_queue.put(EventType.OUTPUT, {})
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        publisher = asyncio.create_task(publish())
+        events = await event_queue.get_all(timeout=5.0)
+        await publisher
+
+        assert loop.time() - start < 1.0
+        assert events[0].type == EventType.STOPPED
+
     @pytest.mark.asyncio
     async def test_get_single_event(self, event_queue):
         """Test getting a single event."""
@@ -180,3 +209,44 @@ class TestDebugEvent:
             timestamp=datetime.now(timezone.utc),
         )
         assert event.data == {}
+
+
+class TestCoalesceOutputEvents:
+    """Tests for merging bursts of output events."""
+
+    @pytest.mark.asyncio
+    async def test_consecutive_output_merged_per_category(self):
+        """Test runs of same-category output merge and other events split runs."""
+        queue = EventQueue()
+        for line in ("a\n", "b\n", "c\n"):
+            await queue.put(EventType.OUTPUT, {"category": "stdout", "output": line})
+        await queue.put(EventType.OUTPUT, {"category": "stderr", "output": "err\n"})
+        await queue.put(EventType.STOPPED, {"reason": "breakpoint"})
+        await queue.put(EventType.OUTPUT, {"category": "stdout", "output": "d\n"})
+
+        events = await queue.get_all(coalesce_output=True)
+
+        assert [e.type for e in events] == [
+            EventType.OUTPUT,
+            EventType.OUTPUT,
+            EventType.STOPPED,
+            EventType.OUTPUT,
+        ]
+        assert events[0].data == {"category": "stdout", "output": "a\nb\nc\n", "count": 3}
+        assert events[1].data == {"category": "stderr", "output": "err\n"}
+        assert events[3].data == {"category": "stdout", "output": "d\n"}
+
+    @pytest.mark.asyncio
+    async def test_not_coalesced_by_default(self):
+        """Test get_all returns every event unless coalescing is requested."""
+        queue = EventQueue()
+        for line in ("a\n", "b\n"):
+            await queue.put(EventType.OUTPUT, {"category": "stdout", "output": line})
+
+        events = await queue.get_all()
+
+        assert [e.data["output"] for e in events] == ["a\n", "b\n"]
+        assert [e.data for e in queue.history] == [
+            {"category": "stdout", "output": "a\n"},
+            {"category": "stdout", "output": "b\n"},
+        ]
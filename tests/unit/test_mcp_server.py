@@ -35,6 +35,7 @@ class TestMCPServerRegistration:
         assert "debug_evaluate" in tools
         assert "debug_inspect_variable" in tools
         assert "debug_get_call_chain" in tools
+        assert "debug_get_frame_state" in tools
 
         # Watch tools
         assert "debug_watch" in tools  # Merged: add/remove/list
@@ -51,9 +52,9 @@ class TestMCPServerRegistration:
     def test_tool_count(self):
         """Test total number of tools."""
         tools = list(mcp._tool_manager._tools.keys())
-        # 28 tools: session (5), breakpoint (3), execution (5 - includes debug_attach),
-        # inspection (6), watch (2), event/output (2), recovery (2), container (3)
-        assert len(tools) == 28
+        # 29 tools: session (5), breakpoint (3), execution (5 - includes debug_attach),
+        # inspection (7), watch (2), event/output (2), recovery (2), container (3)
+        assert len(tools) == 29
 
     def test_server_name(self):
         """Test server name is set."""
@@ -3,7 +3,7 @@
 import pytest
 
 import polybugger_mcp.mcp_server as mcp_server
-from polybugger_mcp.core.session import SessionManager
+from polybugger_mcp.core.session import SessionManager, SessionState
 from polybugger_mcp.mcp_server import (
     _get_manager,
     debug_clear_breakpoints,
@@ -12,6 +12,7 @@ from polybugger_mcp.mcp_server import (
     debug_evaluate,
     debug_evaluate_watches,
     debug_get_breakpoints,
+    debug_get_frame_state,
     debug_get_output,
     debug_get_scopes,
     debug_get_session,
@@ -115,6 +116,25 @@ class TestSessionTools:
         assert result["total"] == 1
         assert len(result["sessions"]) == 1
 
+    @pytest.mark.asyncio
+    async def test_list_sessions_tracks_state_changes(self, session_manager, tmp_path):
+        """Test debug_list_sessions reuses summaries until state or stop reason change."""
+        create_result = await debug_create_session(project_root=str(tmp_path))
+        session = await session_manager.get_session(create_result["session_id"])
+
+        first = (await debug_list_sessions())["sessions"][0]
+        assert first["state"] == "created"
+        assert (await debug_list_sessions())["sessions"][0] is first
+
+        await session.transition_to(SessionState.LAUNCHING)
+        await session.transition_to(SessionState.RUNNING)
+        await session.transition_to(SessionState.PAUSED)
+        session.stop_reason = "breakpoint"
+
+        updated = (await debug_list_sessions())["sessions"][0]
+        assert updated["state"] == "paused"
+        assert updated["stop_reason"] == "breakpoint"
+
     @pytest.mark.asyncio
     async def test_get_session(self, session_manager, tmp_path):
         """Test debug_get_session tool."""
@@ -387,6 +407,27 @@ class TestBreakpointTools:
         assert result["breakpoints"][1]["hit_condition"] == "%2==0"
         assert result["breakpoints"][1]["log_message"] == "Value: {i}"
 
+    @pytest.mark.asyncio
+    async def test_set_breakpoints_with_mismatched_option_lengths(self, session_manager, tmp_path):
+        """Test that short option lists pad with None and long ones are ignored."""
+        test_file = tmp_path / "test.py"
+        test_file.write_text("for i in range(10):\n    x = i\n    y = i * 2\n")
+
+        create_result = await debug_create_session(project_root=str(tmp_path))
+        session_id = create_result["session_id"]
+
+        result = await debug_set_breakpoints(
+            session_id=session_id,
+            file_path=str(test_file),
+            lines=[2, 3],
+            conditions=["i > 3"],
+            log_messages=["a", "b", "c"],
+        )
+
+        assert [bp["line"] for bp in result["breakpoints"]] == [2, 3]
+        assert [bp["condition"] for bp in result["breakpoints"]] == ["i > 3", None]
+        assert [bp["log_message"] for bp in result["breakpoints"]] == ["a", "b"]
+
     @pytest.mark.asyncio
     async def test_get_breakpoints_includes_all_properties(self, session_manager, tmp_path):
         """Test debug_get_breakpoints returns hit_condition and log_message."""
@@ -422,6 +463,34 @@ class TestBreakpointTools:
         assert breakpoints[1]["hit_condition"] == ">=3"
         assert breakpoints[1]["log_message"] is None
 
+    @pytest.mark.asyncio
+    async def test_get_breakpoints_reflects_updates(self, session_manager, tmp_path):
+        """Test debug_get_breakpoints reuses unchanged files and sees changed ones."""
+        first = tmp_path / "first.py"
+        second = tmp_path / "second.py"
+        first.write_text("x = 1\ny = 2\n")
+        second.write_text("a = 1\nb = 2\n")
+
+        create_result = await debug_create_session(project_root=str(tmp_path))
+        session_id = create_result["session_id"]
+        await debug_set_breakpoints(session_id=session_id, file_path=str(first), lines=[1])
+        await debug_set_breakpoints(session_id=session_id, file_path=str(second), lines=[2])
+
+        before = (await debug_get_breakpoints(session_id=session_id))["files"]
+        await debug_set_breakpoints(
+            session_id=session_id, file_path=str(second), lines=[1], conditions=["a"]
+        )
+        after = (await debug_get_breakpoints(session_id=session_id))["files"]
+
+        assert after[str(first)] is before[str(first)]
+        assert after[str(second)] == [
+            {"line": 1, "condition": "a", "hit_condition": None, "log_message": None}
+        ]
+
+        await debug_clear_breakpoints(session_id=session_id)
+        cleared = (await debug_get_breakpoints(session_id=session_id))["files"]
+        assert cleared == {str(first): [], str(second): []}
+
 
 class TestWatchTools:
     """Tests for watch expression tools."""
@@ -643,6 +712,25 @@ class TestExecutionToolsNotFound:
         assert "Invalid mode" in result["error"]
         assert result["code"] == "INVALID_MODE"
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("mode", ["over", "into", "out"])
+    async def test_step_modes_dispatch_to_session(self, session_manager, tmp_path, mode):
+        """Test debug_step calls the session's step method for each mode."""
+        create_result = await debug_create_session(project_root=str(tmp_path))
+        session_id = create_result["session_id"]
+        session = await session_manager.get_session(session_id)
+
+        calls: list[tuple[str, int | None]] = []
+
+        async def record(thread_id: int | None = None) -> None:
+            calls.append((mode, thread_id))
+
+        setattr(session, f"step_{mode}", record)
+
+        result = await debug_step(session_id=session_id, mode=mode, thread_id=7)
+        assert result == {"status": "stepping", "mode": mode}
+        assert calls == [(mode, 7)]
+
     @pytest.mark.asyncio
     async def test_pause_not_found(self, session_manager):
         """Test debug_pause with non-existent session."""
@@ -688,3 +776,153 @@ class TestInspectionToolsNotFound:
         result = await debug_evaluate_watches(session_id="nonexistent")
         assert "error" in result
         assert result["code"] == "NOT_FOUND"
+
+
+class TestFrameStateTool:
+    """Tests for debug_get_frame_state."""
+
+    @staticmethod
+    async def _stub_session(session_manager, tmp_path):
+        """Create a session whose DAP calls return a fixed two-frame stack."""
+        from polybugger_mcp.models.dap import Scope, Source, StackFrame, Variable
+
+        create_result = await debug_create_session(project_root=str(tmp_path))
+        session = await session_manager.get_session(create_result["session_id"])
+        calls: list[tuple[str, int]] = []
+
+        async def get_stack_trace(thread_id=None, start_frame=0, levels=20):
+            return [
+                StackFrame(id=1, name="inner", source=Source(path="/app/a.py"), line=3),
+                StackFrame(id=2, name="outer", source=Source(path="/app/a.py"), line=9),
+            ][:levels]
+
+        async def get_scopes(frame_id):
+            calls.append(("scopes", frame_id))
+            return [
+                Scope(name="Locals", variables_reference=frame_id * 10),
+                Scope(name="Globals", variables_reference=frame_id * 10 + 1, expensive=True),
+            ]
+
+        async def get_variables(variables_ref, start=0, count=100):
+            calls.append(("variables", variables_ref))
+            return [Variable(name="x", value="1", type="int")]
+
+        session.get_stack_trace = get_stack_trace
+        session.get_scopes = get_scopes
+        session.get_variables = get_variables
+        return session, calls
+
+    @pytest.mark.asyncio
+    async def test_expands_top_frame(self, session_manager, tmp_path):
+        """Test the top frame gets scopes and variables for inexpensive scopes."""
+        session, calls = await self._stub_session(session_manager, tmp_path)
+
+        result = await debug_get_frame_state(session_id=session.id, format="json")
+
+        assert result["total"] == 2
+        top, caller = result["frames"]
+        assert [s["name"] for s in top["scopes"]] == ["Locals", "Globals"]
+        assert top["scopes"][0]["variables"][0]["name"] == "x"
+        assert "variables" not in top["scopes"][1]
+        assert "scopes" not in caller
+        assert calls == [("scopes", 1), ("variables", 10)]
+
+    @pytest.mark.asyncio
+    async def test_expand_several_frames_tui(self, session_manager, tmp_path):
+        """Test expanding more frames and the combined TUI output."""
+        session, calls = await self._stub_session(session_manager, tmp_path)
+
+        result = await debug_get_frame_state(session_id=session.id, expand_frames=5)
+
+        assert all("scopes" in f for f in result["frames"])
+        assert sorted(calls) == [
+            ("scopes", 1),
+            ("scopes", 2),
+            ("variables", 10),
+            ("variables", 20),
+        ]
+        assert "LOCALS (inner)" in result["formatted"]
+        assert "LOCALS (outer)" in result["formatted"]
+        assert "call_chain" in result
+
+    @pytest.mark.asyncio
+    async def test_not_found(self, session_manager):
+        """Test debug_get_frame_state with non-existent session."""
+        result = await debug_get_frame_state(session_id="nonexistent")
+        assert result["code"] == "NOT_FOUND"
+
+
+class TestFrameCaches:
+    """Tests for reuse of stack traces and scopes within one stop."""
+
+    @staticmethod
+    async def _paused_session(tmp_path):
+        """Create a paused session backed by a counting fake adapter."""
+        from polybugger_mcp.core.session import Session
+        from polybugger_mcp.models.dap import Scope, StackFrame
+        from polybugger_mcp.models.events import EventType
+
+        class FakeAdapter:
+            def __init__(self):
+                self.calls: list[str] = []
+                self.line = 1
+
+            async def get_stack_trace(self, thread_id, start_frame, levels):
+                self.calls.append("stackTrace")
+                return [StackFrame(id=1, name="main", line=self.line)]
+
+            async def get_scopes(self, frame_id):
+                self.calls.append("scopes")
+                return [Scope(name="Locals", variables_reference=5)]
+
+        session = Session(session_id="frames", project_root=tmp_path)
+        session.adapter = FakeAdapter()
+        await session.transition_to(SessionState.LAUNCHING)
+        await session._handle_event(EventType.STOPPED, {"threadId": 1, "reason": "breakpoint"})
+        return session, session.adapter
+
+    @pytest.mark.asyncio
+    async def test_repeated_polls_reuse_stop_data(self, tmp_path):
+        """Test repeated stacktrace and scopes calls hit the adapter once per stop."""
+        session, adapter = await self._paused_session(tmp_path)
+
+        for _ in range(3):
+            await session.get_stack_trace()
+            await session.get_scopes(1)
+
+        assert adapter.calls == ["stackTrace", "scopes"]
+
+    @pytest.mark.asyncio
+    async def test_new_stop_refreshes(self, tmp_path):
+        """Test resuming or stopping again drops the cached frames."""
+        from polybugger_mcp.models.events import EventType
+
+        session, adapter = await self._paused_session(tmp_path)
+        first = await session.get_stack_trace()
+
+        await session._handle_event(EventType.CONTINUED, {"threadId": 1})
+        adapter.line = 2
+        await session._handle_event(EventType.STOPPED, {"threadId": 1, "reason": "step"})
+        second = await session.get_stack_trace()
+
+        assert first[0].line == 1
+        assert second[0].line == 2
+
+        # A further stop while already paused (e.g. another thread) also refreshes
+        adapter.line = 3
+        await session._handle_event(EventType.STOPPED, {"threadId": 2, "reason": "breakpoint"})
+        third = await session.get_stack_trace(thread_id=1)
+        assert third[0].line == 3
+
+    @pytest.mark.asyncio
+    async def test_not_cached_while_running(self, tmp_path):
+        """Test frames fetched while running are not reused."""
+        from polybugger_mcp.models.events import EventType
+
+        session, adapter = await self._paused_session(tmp_path)
+        await session._handle_event(EventType.CONTINUED, {"threadId": 1})
+
+        await session.get_stack_trace()
+        await session.get_stack_trace()
+
+        assert adapter.calls == ["stackTrace", "stackTrace"]
@@ -66,6 +66,19 @@ class TestOutputBuffer:
         assert len(page3.lines) == 4
         assert page3.has_more is False
 
+    def test_negative_limit_returns_empty_page(self, output_buffer: OutputBuffer) -> None:
+        """Test that a negative limit is clamped instead of raising."""
+        for i in range(3):
+            output_buffer.append("stdout", f"Line {i}\n")
+
+        page = output_buffer.get_page(offset=0, limit=-1)
+        assert page.lines == []
+        assert page.total == 3
+        assert page.has_more is True
+
+        assert output_buffer.get_page(limit=-1, category="stdout").lines == []
+        assert output_buffer.get_since(0, limit=-5).lines == []
+
     def test_get_since_line_number(self, output_buffer: OutputBuffer) -> None:
         """Test getting lines since a specific line number."""
         for i in range(10):
@@ -77,6 +90,43 @@ class TestOutputBuffer:
         assert len(page.lines) == 5
         assert page.lines[0].line_number == 6
 
+    def test_get_since_after_drops(self) -> None:
+        """Test get_since when early lines have been dropped or cursor is out of range."""
+        buffer = OutputBuffer(max_size=100)
+        for i in range(20):
+            buffer.append("stdout", f"Line {i:02d}\n")
+
+        first = buffer.get_page().lines[0].line_number
+        assert first > 1
+
+        # Cursor before the oldest retained line returns everything retained
+        page = buffer.get_since(line_number=0, limit=100)
+        assert page.total == buffer.total_lines
+        assert page.lines[0].line_number == first
+
+        page = buffer.get_since(line_number=first + 2, limit=2)
+        assert [line.line_number for line in page.lines] == [first + 3, first + 4]
+        assert page.has_more is True
+
+        assert buffer.get_since(line_number=buffer.last_line_number).lines == []
+        assert buffer.get_since(line_number=buffer.last_line_number + 5).total == 0
+
+    def test_category_totals_track_drops(self) -> None:
+        """Test filtered totals stay correct as old entries are dropped."""
+        buffer = OutputBuffer(max_size=60)
+        for i in range(10):
+            buffer.append("stdout" if i % 2 else "stderr", f"Line {i}\n")
+
+        retained = buffer.get_page(limit=100).lines
+        for category in ("stdout", "stderr"):
+            page = buffer.get_page(category=category, limit=100)
+            expected = [line for line in retained if line.category == category]
+            assert page.total == len(expected)
+            assert page.lines == expected
+
+        page = buffer.get_page(offset=1, limit=1, category="stdout")
+        assert page.lines == [line for line in retained if line.category == "stdout"][1:2]
+
     def test_ring_buffer_drops_old_entries(self) -> None:
         """Test that old entries are dropped when buffer is full."""
         # Create small buffer (100 bytes)
@@ -81,6 +81,15 @@ class TestWatchExpressions:
         watches.append("y")
         assert "y" not in session.list_watches()
 
+    def test_watches_keep_insertion_order(self, session: Session):
+        """Test watches stay in the order added, across removals and re-adds."""
+        for expr in ("a", "b", "c"):
+            session.add_watch(expr)
+        session.add_watch("a")
+        session.remove_watch("b")
+        session.add_watch("b")
+        assert session.list_watches() == ["a", "c", "b"]
+
 
 class TestWatchPersistence:
     """Tests for watch expression persistence in session recovery."""
@@ -104,3 +113,41 @@ class TestWatchPersistence:
         watches = recovered.list_watches()
         assert "x * 2" in watches
         assert "len(items)" in watches
+
+
+class TestWatchEvaluation:
+    """Tests for evaluating watch expressions."""
+
+    @pytest.mark.asyncio
+    async def test_evaluates_concurrently_in_order(self, session: Session):
+        """Test watches are sent together and results keep watch order."""
+        import asyncio
+
+        from polybugger_mcp.core.session import SessionState
+
+        in_flight = 0
+        peak = 0
+
+        class FakeAdapter:
+            async def evaluate(self, expression, frame_id, context):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                if expression == "missing":
+                    raise RuntimeError("name 'missing' is not defined")
+                return {"result": expression.upper(), "type": "str"}
+
+        session.adapter = FakeAdapter()
+        session._state = SessionState.PAUSED
+        for expr in ("a", "missing", "c"):
+            session.add_watch(expr)
+
+        results = await session.evaluate_watches()
+
+        assert peak == 3
+        assert [r["expression"] for r in results] == ["a", "missing", "c"]
+        assert results[0]["result"] == "A"
+        assert results[1]["error"] == "name 'missing' is not defined"
+        assert results[2]["variables_reference"] == 0